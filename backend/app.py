@@ -17,17 +17,302 @@ Technologies Used:
 - Rule-based analysis: Pattern matching and templates (FREE)
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, g, request, jsonify
 from flask_cors import CORS
-import requests
 from bs4 import BeautifulSoup
+import contextvars
+import hashlib
 import json
+import os
+import requests
 import time
-import re
-from urllib.parse import urljoin, urlparse, quote_plus
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache, partial
+from urllib.parse import parse_qs, urljoin, urlparse, quote_plus
+
+from cache import AnalysisCache
+from catalog import HackathonCatalog, normalize_name
+from compression import Compressor
+from fragments import FragmentCache, encode_json
+from html_extract import extract_text_from_bytes, extract_visible_text, read_body
+from http_client import DeadlineExceeded, HttpClient, throttle_var
+from jobs import JobManager, QueueFull, sse_events
+from keyword_matcher import KeywordMatcher
+from offload import CpuPool, OffloadError
+from metrics import CONTENT_TYPE, REGISTRY, Counter, Gauge, Histogram
+from resilience import AdaptiveTimeout, CircuitBreaker, current_deadline, deadline_scope
+from search_index import HackathonIndex, fts5_available
+from prewarm import PopularityTracker, Prewarmer, RateLimiter
+from observability import configure_logging, get_logger, server_timing_header, span, start_request
+from singleflight import SingleFlight
 
 app = Flask(__name__)
-CORS(app)  # Enable CORS for React frontend
+CORS(app, expose_headers=['ETag'])  # Enable CORS for React frontend
+
+# Structured JSON logs, each line tagged with the request id
+configure_logging(os.environ.get('HACKATHON_LOG_LEVEL', 'INFO'))
+logger = get_logger('app')
+
+HTTP_REQUESTS = Counter(
+    'hackathon_http_requests_total',
+    'API requests by endpoint and status code',
+    ['endpoint', 'method', 'status'],
+)
+HTTP_DURATION = Histogram(
+    'hackathon_http_request_duration_seconds',
+    'API request latency by endpoint',
+    ['endpoint'],
+)
+HTTP_IN_FLIGHT = Gauge(
+    'hackathon_http_requests_in_flight',
+    'API requests currently being handled',
+)
+SCRAPE_OUTCOMES = Counter(
+    'hackathon_scrape_outcomes_total',
+    'How hedged scraping ended (first result won, a hedge won, texts merged, nothing)',
+    ['outcome'],
+)
+SCRAPE_CANCELLED = Counter(
+    'hackathon_scrape_cancelled_total',
+    'Hedged page fetches cancelled after another page won',
+)
+
+# Result cache settings (all optional - sensible defaults, no .env required)
+CACHE_MAX_ENTRIES = int(os.environ.get('HACKATHON_CACHE_SIZE', 256))
+CACHE_TTL_SECONDS = float(os.environ.get('HACKATHON_CACHE_TTL', 6 * 3600))
+CACHE_STALE_SECONDS = float(os.environ.get('HACKATHON_CACHE_STALE_TTL', 24 * 3600))
+CACHE_DB_PATH = os.environ.get('HACKATHON_CACHE_DB') or None
+
+analysis_cache = AnalysisCache(
+    max_entries=CACHE_MAX_ENTRIES,
+    ttl=CACHE_TTL_SECONDS,
+    stale_ttl=CACHE_STALE_SECONDS,
+    db_path=CACHE_DB_PATH,
+    # Degraded results (search circuit open, budget spent) are served but not kept
+    cacheable=lambda result: bool(result and result.get('success') and not result.get('degraded')),
+)
+
+# Identical lookups that are in flight at the same time share one pipeline run
+pipeline_flight = SingleFlight()
+
+# Local full-text index of analyzed hackathons ('' disables it)
+INDEX_DB_PATH = os.environ.get(
+    'HACKATHON_INDEX_DB', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'hackathon_index.db')
+)
+INDEX_MAX_AGE_SECONDS = float(os.environ.get('HACKATHON_INDEX_MAX_AGE', 7 * 24 * 3600))
+
+hackathon_index = None
+if INDEX_DB_PATH:
+    if fts5_available():
+        hackathon_index = HackathonIndex(INDEX_DB_PATH, max_age=INDEX_MAX_AGE_SECONDS)
+    else:
+        logger.warning("SQLite FTS5 is not available - hackathon index disabled")
+
+# Catalog of known hackathons (name, aliases, official URL; '' disables it).
+# Names it knows exactly skip the external search and get a canonical cache
+# key; near misses are only used as a fallback when the search fails
+CATALOG_PATH = os.environ.get(
+    'HACKATHON_CATALOG', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'hackathon_catalog.json')
+)
+CATALOG_MIN_SCORE = float(os.environ.get('HACKATHON_CATALOG_MIN_SCORE', 0.75))
+
+catalog = HackathonCatalog([], min_score=CATALOG_MIN_SCORE)
+if CATALOG_PATH:
+    try:
+        catalog = HackathonCatalog.load(CATALOG_PATH, min_score=CATALOG_MIN_SCORE)
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning("Hackathon catalog not loaded", extra={'path': CATALOG_PATH, 'error': str(e)})
+
+# Pre-encoded JSON fragments for the template sections of a response
+FRAGMENT_CACHE_SIZE = int(os.environ.get('HACKATHON_FRAGMENT_CACHE_SIZE', 2048))
+
+# Negotiated gzip/brotli response compression
+COMPRESSION_ENABLED = os.environ.get('HACKATHON_COMPRESSION', '1') != '0'
+COMPRESS_MIN_BYTES = int(os.environ.get('HACKATHON_COMPRESS_MIN_BYTES', 1024))
+compressor = Compressor(min_size=COMPRESS_MIN_BYTES)
+
+# Results kept by source-text fingerprint (skips re-analysis of unchanged pages)
+ANALYSIS_MEMO_SIZE = int(os.environ.get('HACKATHON_ANALYSIS_MEMO_SIZE', 1024))
+ANALYSIS_MEMO_TTL_SECONDS = float(os.environ.get('HACKATHON_ANALYSIS_MEMO_TTL', 7 * 24 * 3600))
+
+# Batch analysis settings
+BATCH_MAX_ITEMS = int(os.environ.get('HACKATHON_BATCH_MAX_ITEMS', 50))
+BATCH_MAX_WORKERS = int(os.environ.get('HACKATHON_BATCH_WORKERS', 16))
+MAX_REQUESTS_PER_HOST = int(os.environ.get('HACKATHON_MAX_REQUESTS_PER_HOST', 4))
+
+batch_executor = ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS, thread_name_prefix='batch')
+
+# Background job settings (async analyses + SSE progress)
+JOB_MAX_WORKERS = int(os.environ.get('HACKATHON_JOB_WORKERS', 8))
+JOB_TTL_SECONDS = float(os.environ.get('HACKATHON_JOB_TTL', 600))
+JOB_MAX_PENDING = int(os.environ.get('HACKATHON_JOB_MAX_PENDING', 4 * JOB_MAX_WORKERS))
+
+job_manager = JobManager(max_workers=JOB_MAX_WORKERS, ttl=JOB_TTL_SECONDS, max_pending=JOB_MAX_PENDING)
+
+# Shared HTTP client settings (connection pool, retries, timeouts)
+HTTP_POOL_CONNECTIONS = int(os.environ.get('HACKATHON_HTTP_POOL_CONNECTIONS', 20))
+HTTP_POOL_MAXSIZE = int(os.environ.get('HACKATHON_HTTP_POOL_MAXSIZE', 20))
+HTTP_MAX_RETRIES = int(os.environ.get('HACKATHON_HTTP_MAX_RETRIES', 2))
+SEARCH_URL = os.environ.get('HACKATHON_SEARCH_URL', 'https://html.duckduckgo.com/html/')
+SEARCH_TIMEOUT_SECONDS = float(os.environ.get('HACKATHON_SEARCH_TIMEOUT', 10))
+SCRAPE_TIMEOUT_SECONDS = float(os.environ.get('HACKATHON_SCRAPE_TIMEOUT', 15))
+
+# Page extraction settings - streaming mode reads at most SCRAPE_MAX_BYTES and
+# stops as soon as SCRAPE_MAX_CHARS of visible text are collected
+SCRAPE_STREAMING = os.environ.get('HACKATHON_SCRAPE_STREAMING', '1') != '0'
+SCRAPE_MAX_CHARS = int(os.environ.get('HACKATHON_SCRAPE_MAX_CHARS', 5000))
+SCRAPE_MAX_BYTES = int(os.environ.get('HACKATHON_SCRAPE_MAX_BYTES', 2 * 1024 * 1024))
+
+# Hedged scraping: the top SCRAPE_FANOUT results are fetched in rank order,
+# each one started SCRAPE_HEDGE_DELAY after the previous (or at once if the
+# previous one came back without enough text). The first page with at least
+# SCRAPE_MIN_USEFUL_CHARS of text wins and the others are cancelled.
+SCRAPE_FANOUT = int(os.environ.get('HACKATHON_SCRAPE_FANOUT', 3))
+SCRAPE_HEDGE_DELAY_SECONDS = float(os.environ.get('HACKATHON_SCRAPE_HEDGE_DELAY', 0.3))
+SCRAPE_MIN_USEFUL_CHARS = int(os.environ.get('HACKATHON_SCRAPE_MIN_CHARS', 500))
+SCRAPE_WORKERS = int(os.environ.get('HACKATHON_SCRAPE_WORKERS', 32))
+
+scrape_executor = ThreadPoolExecutor(max_workers=SCRAPE_WORKERS, thread_name_prefix='scrape')
+
+# Worker processes serving the app (serve.py sets this to its --workers).
+# Per-process budgets below - prewarm rates, CPU pool size - are this
+# process's share, so the server as a whole stays within them
+SERVER_WORKERS = max(1, int(os.environ.get('HACKATHON_WORKERS', 1)))
+
+# CPU-bound work (search/page parsing, analysis) can run in a process pool so
+# it does not hold the GIL on request threads; downloads stay on threads.
+# At most CPU_MAX_PENDING tasks are queued or running; a task past
+# CPU_TASK_TIMEOUT is killed. Every server worker has its own pool, so by
+# default they split the CPUs between them
+CPU_OFFLOAD = os.environ.get('HACKATHON_CPU_OFFLOAD', '0') != '0'
+CPU_WORKERS = int(os.environ.get('HACKATHON_CPU_WORKERS', max(1, (os.cpu_count() or 1) // SERVER_WORKERS)))
+CPU_MAX_PENDING = int(os.environ.get('HACKATHON_CPU_MAX_PENDING', 2 * CPU_WORKERS))
+CPU_TASK_TIMEOUT_SECONDS = float(os.environ.get('HACKATHON_CPU_TASK_TIMEOUT', 2))
+CPU_QUEUE_WAIT_SECONDS = float(os.environ.get('HACKATHON_CPU_QUEUE_WAIT', 0.5))
+
+cpu_pool = CpuPool(
+    workers=CPU_WORKERS,
+    max_pending=CPU_MAX_PENDING,
+    task_timeout=CPU_TASK_TIMEOUT_SECONDS,
+    queue_wait=CPU_QUEUE_WAIT_SECONDS,
+    # Workers import this module once, not on their first analysis
+    preload=(__name__,),
+)
+
+# Latency budget: each pipeline run gets REQUEST_BUDGET_SECONDS in total.
+# Search may use at most SEARCH_BUDGET_SHARE of it; scraping gets what is left
+# minus ANALYSIS_RESERVE_SECONDS and is skipped below MIN_SCRAPE_SECONDS.
+REQUEST_BUDGET_SECONDS = float(os.environ.get('HACKATHON_REQUEST_BUDGET', 8))
+SEARCH_BUDGET_SHARE = float(os.environ.get('HACKATHON_SEARCH_BUDGET_SHARE', 0.5))
+ANALYSIS_RESERVE_SECONDS = float(os.environ.get('HACKATHON_ANALYSIS_RESERVE', 0.25))
+MIN_SCRAPE_SECONDS = float(os.environ.get('HACKATHON_MIN_SCRAPE_SECONDS', 0.25))
+
+# Adaptive timeouts: 3x the recent p95 latency, between the floor and the
+# fixed timeouts above (which now act as ceilings)
+TIMEOUT_FLOOR_SECONDS = float(os.environ.get('HACKATHON_TIMEOUT_FLOOR', 0.5))
+search_timeout = AdaptiveTimeout(SEARCH_TIMEOUT_SECONDS, TIMEOUT_FLOOR_SECONDS, SEARCH_TIMEOUT_SECONDS)
+scrape_timeout = AdaptiveTimeout(SCRAPE_TIMEOUT_SECONDS, TIMEOUT_FLOOR_SECONDS, SCRAPE_TIMEOUT_SECONDS)
+
+# Circuit breaker for the search backend: after repeated failures go straight
+# to stored/fallback results until a probe succeeds
+search_breaker = CircuitBreaker(
+    'search',
+    failure_threshold=int(os.environ.get('HACKATHON_SEARCH_BREAKER_FAILURES', 5)),
+    reset_timeout=float(os.environ.get('HACKATHON_SEARCH_BREAKER_RESET', 30)),
+)
+
+# Background prewarming of popular names (see prewarm.py). The rate limits
+# apply to the prewarmer's own upstream requests only. Each worker process
+# has its own cache and so its own prewarmer; it gets 1/SERVER_WORKERS of
+# the configured rates.
+PREWARM_ENABLED = os.environ.get('HACKATHON_PREWARM', '1') != '0'
+PREWARM_NAMES = [name.strip() for name in os.environ.get(
+    'HACKATHON_PREWARM_NAMES',
+    'MLH Hackathon 2025,Google Cloud Hackathon,NASA Space Apps Challenge,HackMIT,TreeHacks,ETHGlobal'
+).split(',') if name.strip()]
+PREWARM_INTERVAL_SECONDS = float(os.environ.get('HACKATHON_PREWARM_INTERVAL', 60))
+PREWARM_REFRESH_AHEAD_SECONDS = float(os.environ.get('HACKATHON_PREWARM_REFRESH_AHEAD', 1800))
+PREWARM_TOP_N = int(os.environ.get('HACKATHON_PREWARM_TOP_N', 20))
+PREWARM_MIN_LOOKUPS = float(os.environ.get('HACKATHON_PREWARM_MIN_LOOKUPS', 2))
+PREWARM_MAX_PER_CYCLE = int(os.environ.get('HACKATHON_PREWARM_MAX_PER_CYCLE', 10))
+PREWARM_SEARCH_RATE = float(os.environ.get('HACKATHON_PREWARM_SEARCH_RATE', 0.2))
+PREWARM_PAGE_RATE = float(os.environ.get('HACKATHON_PREWARM_PAGE_RATE', 0.5))
+
+popularity = PopularityTracker()
+prewarm_limiter = RateLimiter(
+    PREWARM_PAGE_RATE / SERVER_WORKERS,
+    rates={urlparse(SEARCH_URL).netloc.lower(): PREWARM_SEARCH_RATE / SERVER_WORKERS}
+)
+
+http_client = HttpClient(
+    pool_connections=HTTP_POOL_CONNECTIONS,
+    pool_maxsize=HTTP_POOL_MAXSIZE,
+    max_retries=HTTP_MAX_RETRIES,
+    max_per_host=MAX_REQUESTS_PER_HOST,
+    metric_hosts=[urlparse(SEARCH_URL).netloc],
+)
+
+
+@app.before_request
+def begin_request():
+    """Assign a request id (or reuse the caller's X-Request-ID) and start timing"""
+    g.request_id = request.headers.get('X-Request-ID', '')[:128] or uuid.uuid4().hex
+    g.started_at = time.perf_counter()
+    start_request(g.request_id)
+    HTTP_IN_FLIGHT.inc()
+    if PREWARM_ENABLED:
+        # Started lazily so every (forked) worker process gets its own thread
+        prewarmer.start()
+
+
+@app.after_request
+def finish_request(response):
+    """Compress the body, attach X-Request-ID and Server-Timing headers and record request metrics"""
+    if COMPRESSION_ENABLED:
+        compressor.compress_response(response, request.accept_encodings)
+    elapsed = time.perf_counter() - g.started_at
+    endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+    
+    extra = []
+    if response.headers.get('X-Cache'):
+        extra.append(f'cache;desc="{response.headers["X-Cache"]}"')
+    response.headers['Server-Timing'] = server_timing_header(total=elapsed, extra=extra)
+    response.headers['X-Request-ID'] = g.request_id
+    
+    HTTP_REQUESTS.inc(endpoint=endpoint, method=request.method, status=response.status_code)
+    HTTP_DURATION.observe(elapsed, endpoint=endpoint)
+    return response
+
+
+@app.teardown_request
+def end_request(exc):
+    if 'started_at' in g:
+        HTTP_IN_FLIGHT.dec()
+
+
+def resolve_hackathon_name(hackathon_name):
+    """
+    Look a name up in the catalog (exact names and aliases only) and derive
+    its cache key
+    
+    Catalog names map to their canonical entry, so spellings of the same
+    hackathon share one key: "Tree Hacks 2025" -> "treehacks 2025"
+    
+    Returns:
+        tuple: (catalog resolution or None, cache key)
+    """
+    with span('catalog.resolve'):
+        resolution = catalog.resolve(hackathon_name)
+    return resolution, resolution['key'] if resolution is not None else normalize_name(hackathon_name)
+
+
+def normalize_hackathon_name(hackathon_name):
+    """
+    Normalize a hackathon name into a stable cache key
+    e.g. "  TreeHacks   2025! " -> "treehacks 2025"
+    """
+    return resolve_hackathon_name(hackathon_name)[1]
 
 
 # FREE search using DuckDuckGo HTML (no API key needed!)
@@ -42,72 +327,130 @@ def search_hackathon_page(hackathon_name):
     Returns:
         dict: Search results with URLs and snippets
     """
+    if not search_breaker.allow():
+        # The search backend keeps failing - don't make this request wait on it
+        return {**get_fallback_results(hackathon_name), 'degraded': True}
+    
+    # Search may use its share of the request's latency budget, retries included
+    deadline = current_deadline()
+    stage_deadline = deadline.child(share=SEARCH_BUDGET_SHARE) if deadline is not None else None
+    timeout = search_timeout.current()
+    
     try:
         # DuckDuckGo HTML search (completely free!)
         search_query = quote_plus(f"{hackathon_name} official hackathon")
-        search_url = f"https://html.duckduckgo.com/html/?q={search_query}"
+        search_url = f"{SEARCH_URL}?q={search_query}"
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
+        started = time.monotonic()
+        with span('search.fetch'):
+            response = http_client.get(search_url, timeout=timeout, deadline=stage_deadline)
+        search_timeout.observe(time.monotonic() - started)
         
-        response = requests.get(search_url, headers=headers, timeout=10)
+        if response.status_code != 200:
+            search_breaker.record_failure()
+            return {**get_fallback_results(hackathon_name), 'degraded': True}
         
-        if response.status_code == 200:
-            soup = BeautifulSoup(response.content, 'html.parser')
-            results = soup.find_all('div', class_='result__body', limit=3)
-            
-            search_results = []
-            for result in results:
-                title_tag = result.find('a', class_='result__a')
-                snippet_tag = result.find('a', class_='result__snippet')
-                
-                if title_tag:
-                    search_results.append({
-                        'title': title_tag.get_text(strip=True),
-                        'link': title_tag.get('href', ''),
-                        'snippet': snippet_tag.get_text(strip=True) if snippet_tag else ''
-                    })
-            
-            if search_results:
-                return {
-                    'success': True,
-                    'results': search_results
-                }
+        search_breaker.record_success()
+        with span('search.parse'):
+            search_results = run_cpu(parse_search_results, response.content, deadline=stage_deadline)
+        
+        if search_results:
+            return {
+                'success': True,
+                'results': search_results,
+                'source': 'search'
+            }
         
         # Fallback: Use predefined URLs for common hackathons
         return get_fallback_results(hackathon_name)
+    
+    except OffloadError as e:
+        # Our parser pool is busy - not a failure of the search backend
+        logger.warning("Search parse skipped", extra={'error': str(e)})
+        return {**get_fallback_results(hackathon_name), 'degraded': True}
+    
+    except DeadlineExceeded as e:
+        # Budget spent on our side (slot wait, shortened attempt) - says
+        # nothing about the backend's health
+        logger.warning("Search skipped", extra={'error': str(e)})
+        search_breaker.release()
+        return {**get_fallback_results(hackathon_name), 'degraded': True}
         
     except Exception as e:
-        print(f"Search error: {str(e)}")
-        return get_fallback_results(hackathon_name)
+        logger.warning("Search error", extra={'error': str(e)})
+        search_breaker.record_failure()
+        if isinstance(e, requests.Timeout):
+            # Let a slowing backend push the adaptive timeout up
+            search_timeout.observe(timeout)
+        return {**get_fallback_results(hackathon_name), 'degraded': True}
+
+def parse_search_results(content):
+    """
+    Top results of a DuckDuckGo HTML results page
+    
+    Args:
+        content (bytes): Raw results page
+        
+    Returns:
+        list: Up to three {'title', 'link', 'snippet'} dicts
+    """
+    soup = BeautifulSoup(content, 'html.parser')
+    results = soup.find_all('div', class_='result__body', limit=3)
+    
+    search_results = []
+    for result in results:
+        title_tag = result.find('a', class_='result__a')
+        snippet_tag = result.find('a', class_='result__snippet')
+        
+        if title_tag:
+            search_results.append({
+                'title': title_tag.get_text(strip=True),
+                'link': resolve_result_link(title_tag.get('href', '')),
+                'snippet': snippet_tag.get_text(strip=True) if snippet_tag else ''
+            })
+    return search_results
+
+
+def run_cpu(fn, *args, deadline=None):
+    """
+    Run a CPU-bound function in the process pool (HACKATHON_CPU_OFFLOAD) or inline
+    
+    Raises:
+        OffloadError: The pool was saturated or the task overran its time limit
+    """
+    if CPU_OFFLOAD:
+        return cpu_pool.run(fn, *args, deadline=deadline)
+    return fn(*args)
 
 # Fallback URLs for popular hackathons (completely free!)
 def get_fallback_results(hackathon_name):
-    """Fallback URLs for popular hackathons"""
-    common_hackathons = {
-        'mlh': [{'title': 'Major League Hacking', 'link': 'https://mlh.io', 'snippet': 'Official MLH hackathon platform'}],
-        'google cloud': [{'title': 'Google Cloud Hackathon', 'link': 'https://cloud.google.com', 'snippet': 'Google Cloud developer challenges'}],
-        'nasa': [{'title': 'NASA Space Apps', 'link': 'https://www.spaceappschallenge.org', 'snippet': 'NASA Space Apps Challenge'}],
-        'hackmit': [{'title': 'HackMIT', 'link': 'https://hackmit.org', 'snippet': 'MIT annual hackathon'}],
-        'treehacks': [{'title': 'TreeHacks', 'link': 'https://www.treehacks.com', 'snippet': 'Stanford hackathon'}],
-        'ethglobal': [{'title': 'ETHGlobal', 'link': 'https://ethglobal.com', 'snippet': 'Ethereum hackathon series'}],
-    }
+    """
+    Fallback URLs for popular hackathons, from the catalog
     
-    name_lower = hackathon_name.lower()
-    for key, results in common_hackathons.items():
-        if key in name_lower:
-            return {'success': True, 'results': results}
+    As the search already failed, near misses ("treehaks" -> TreeHacks) and
+    a known name inside a longer one ("ETHGlobal Paris" -> ETHGlobal) are
+    accepted too.
+    """
+    resolution = catalog.resolve(hackathon_name, allow_fuzzy=True, allow_partial=True)
+    if resolution is not None and resolution['entry']['url']:
+        return {'success': True, 'results': catalog.search_results(resolution), 'source': 'fallback'}
     
-    return {'success': True, 'results': [{'title': hackathon_name, 'link': '', 'snippet': 'Hackathon information'}]}
+    return {
+        'success': True,
+        'results': [{'title': hackathon_name, 'link': '', 'snippet': 'Hackathon information'}],
+        'source': 'fallback'
+    }
 
 
-def scrape_hackathon_page(url):
+def scrape_hackathon_page(url, stage_deadline=None):
     """
     Scrape hackathon page to extract relevant information (FREE)
     
     Args:
         url (str): URL of the hackathon page
+        stage_deadline (Deadline): Deadline for this fetch; defaults to what
+                                   is left of the request budget minus the
+                                   analysis reserve
         
     Returns:
         str: Extracted text content from the page
@@ -115,37 +458,241 @@ def scrape_hackathon_page(url):
     if not url:
         return ""
     
+    if stage_deadline is None:
+        deadline = current_deadline()
+        stage_deadline = deadline.child(reserve=ANALYSIS_RESERVE_SECONDS) if deadline is not None else None
+    timeout = scrape_timeout.current()
+    started = time.monotonic()
+    
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
+        if SCRAPE_STREAMING and CPU_OFFLOAD:
+            # Download on this thread, parse the raw bytes in the process pool
+            text = http_client.get_extracted(
+                url,
+                lambda response: extract_offloaded(response, stage_deadline),
+                timeout=timeout,
+                deadline=stage_deadline,
+            )
+            scrape_timeout.observe(time.monotonic() - started)
+            return text or ""
         
-        response = requests.get(url, headers=headers, timeout=15)
+        if SCRAPE_STREAMING:
+            # Stream the body through an incremental tokenizer (bounded memory);
+            # download and parsing overlap, so they share one span
+            with span('scrape.stream'):
+                text = http_client.get_extracted(
+                    url,
+                    lambda response: extract_visible_text(
+                        response, max_chars=SCRAPE_MAX_CHARS, max_bytes=SCRAPE_MAX_BYTES,
+                        deadline=stage_deadline
+                    ),
+                    timeout=timeout,
+                    deadline=stage_deadline,
+                )
+            scrape_timeout.observe(time.monotonic() - started)
+            return text or ""
+        
+        with span('scrape.fetch'):
+            response = http_client.get(url, timeout=timeout, deadline=stage_deadline)
+        scrape_timeout.observe(time.monotonic() - started)
         
         if response.status_code == 200:
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Remove script and style elements
-            for script in soup(["script", "style", "nav", "footer"]):
-                script.decompose()
-            
-            # Get text content
-            text = soup.get_text(separator=' ', strip=True)
-            
-            # Limit text length
-            max_length = 5000
-            if len(text) > max_length:
-                text = text[:max_length] + "..."
-            
-            return text
+            with span('scrape.parse'):
+                return run_cpu(parse_page_html, response.content, SCRAPE_MAX_CHARS, deadline=stage_deadline)
         
         return ""
         
     except Exception as e:
-        print(f"Scraping error: {str(e)}")
+        if stage_deadline is not None and stage_deadline.expired:
+            # Budget spent, or a hedged fetch that lost the race - expected
+            logger.debug("Scrape stopped at deadline", extra={'url': url, 'error': str(e)})
+            return ""
+        logger.warning("Scraping error", extra={'url': url, 'error': str(e)})
+        if isinstance(e, requests.Timeout):
+            scrape_timeout.observe(timeout)
         return ""
 
 
+def parse_page_html(content, max_chars):
+    """
+    Visible text of a downloaded page (BeautifulSoup path)
+    
+    Args:
+        content (bytes): Raw HTML
+        max_chars (int): Characters to keep
+        
+    Returns:
+        str: Page text, truncated with a trailing "..."
+    """
+    soup = BeautifulSoup(content, 'html.parser')
+    
+    # Remove script and style elements
+    for script in soup(["script", "style", "nav", "footer"]):
+        script.decompose()
+    
+    # Get text content
+    text = soup.get_text(separator=' ', strip=True)
+    
+    # Limit text length
+    if len(text) > max_chars:
+        text = text[:max_chars] + "..."
+    
+    return text
+
+
+def extract_offloaded(response, stage_deadline):
+    """Read a streaming response on this thread and extract its text in the process pool"""
+    with span('scrape.fetch'):
+        body, charset = read_body(response, max_bytes=SCRAPE_MAX_BYTES, deadline=stage_deadline)
+    with span('scrape.parse'):
+        return run_cpu(extract_text_from_bytes, body, charset, SCRAPE_MAX_CHARS, deadline=stage_deadline)
+
+
+def resolve_result_link(link):
+    """
+    Turn a search result href into a fetchable URL
+    
+    DuckDuckGo wraps results in //duckduckgo.com/l/?uddg=<url> redirects;
+    scraping the redirect page would only return DuckDuckGo's own markup.
+    """
+    if link.startswith('//'):
+        link = 'https:' + link
+    parsed = urlparse(link)
+    if parsed.netloc.endswith('duckduckgo.com') and parsed.path.startswith('/l/'):
+        target = parse_qs(parsed.query).get('uddg')
+        if target:
+            return target[0]
+    return link
+
+
+def scrape_top_results(search_results):
+    """
+    Hedged scraping of the top search results
+    
+    Pages are requested in rank order; each further page starts after
+    SCRAPE_HEDGE_DELAY_SECONDS, or right away when the previous one came
+    back with too little text. The first page with SCRAPE_MIN_USEFUL_CHARS
+    of text wins and the remaining fetches are cancelled. If none gets there
+    before the budget runs out, the texts that did arrive are merged in rank
+    order.
+    
+    Args:
+        search_results (list): Search results ({'title', 'link', 'snippet'})
+        
+    Returns:
+        tuple: (text, url of the page the text came from, or None)
+    """
+    urls = []
+    for result in search_results:
+        url = resolve_result_link(result.get('link', ''))
+        if url and url not in urls:
+            urls.append(url)
+    urls = urls[:max(1, SCRAPE_FANOUT)]
+    if not urls:
+        return "", None
+    
+    deadline = current_deadline()
+    stage_deadline = deadline.child(reserve=ANALYSIS_RESERVE_SECONDS) if deadline is not None else None
+    
+    fetches = {}  # future -> (rank, url, deadline of that fetch)
+    texts = {}  # rank -> text
+    pending = set()
+    next_rank = 0
+    next_start = time.monotonic()
+    winner = None
+    
+    while winner is None:
+        now = time.monotonic()
+        if next_rank < len(urls) and (now >= next_start or not pending):
+            fetch_deadline = stage_deadline.child() if stage_deadline is not None else None
+            # Copy the context so spans and log lines keep the request id
+            future = scrape_executor.submit(
+                contextvars.copy_context().run, scrape_hackathon_page, urls[next_rank], fetch_deadline
+            )
+            fetches[future] = (next_rank, urls[next_rank], fetch_deadline)
+            pending.add(future)
+            next_rank += 1
+            next_start = now + SCRAPE_HEDGE_DELAY_SECONDS
+            continue
+        
+        if not pending or (stage_deadline is not None and stage_deadline.expired):
+            break
+        
+        timeout = max(0.0, next_start - now) if next_rank < len(urls) else None
+        if stage_deadline is not None:
+            timeout = min(timeout if timeout is not None else float('inf'), stage_deadline.remaining())
+        done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+        
+        for future in sorted(done, key=lambda f: fetches[f][0]):
+            rank = fetches[future][0]
+            texts[rank] = future.result() or ""
+            if len(texts[rank]) >= SCRAPE_MIN_USEFUL_CHARS and winner is None:
+                winner = rank
+            else:
+                # Not enough text - don't wait out the hedge delay for the next page
+                next_start = time.monotonic()
+    
+    # Losing (or late) fetches stop at their next deadline check
+    for future in pending:
+        fetch_deadline = fetches[future][2]
+        if fetch_deadline is not None:
+            fetch_deadline.cancel()
+        SCRAPE_CANCELLED.inc()
+    
+    if winner is not None:
+        SCRAPE_OUTCOMES.inc(outcome='first' if winner == 0 else 'hedge')
+        return texts[winner], urls[winner]
+    
+    useful = [(rank, text) for rank, text in sorted(texts.items()) if text]
+    if not useful:
+        SCRAPE_OUTCOMES.inc(outcome='empty')
+        return "", None
+    
+    SCRAPE_OUTCOMES.inc(outcome='merged')
+    merged = ' '.join(text for _, text in useful)
+    if len(merged) > SCRAPE_MAX_CHARS:
+        merged = merged[:SCRAPE_MAX_CHARS] + "..."
+    return merged, urls[useful[0][0]]
+
+
+# Response sections a caller can select with fields=...; the header fields
+# (name, source URL, timestamp) are always returned
+HEADER_FIELDS = ('hackathon_name', 'source_url', 'analyzed_at')
+ANALYSIS_FIELDS = ('domain', 'summary', 'technologies', 'timeline', 'requirements',
+                   'reference_projects', 'tool_guides', 'tips')
+
+
+def parse_fields(value):
+    """
+    Parse a fields selection ("timeline,technologies" or a list)
+    
+    Returns:
+        frozenset or None: Selected sections, None for all of them
+        
+    Raises:
+        ValueError: For unknown section names, or a value that is not a
+                    string or a list of strings
+    """
+    if value is None:
+        return None
+    names = value.split(',') if isinstance(value, str) else value
+    if not isinstance(names, list) or not all(isinstance(name, str) for name in names):
+        raise ValueError("fields must be a comma-separated string or a list of strings")
+    fields = frozenset(name.strip() for name in names if name.strip())
+    unknown = fields - set(ANALYSIS_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))} "
+                         f"(choose from {', '.join(ANALYSIS_FIELDS)})")
+    return fields or None
+
+
+def select_fields(data, fields):
+    """Header fields plus the selected sections of an analysis"""
+    if fields is None:
+        return data
+    return {key: value for key, value in data.items() if key in HEADER_FIELDS or key in fields}
+
+
 def analyze_with_smart_templates(hackathon_name, web_content, search_snippets):
     """
     FREE intelligent analysis using rule-based patterns and templates
@@ -163,32 +710,35 @@ def analyze_with_smart_templates(hackathon_name, web_content, search_snippets):
         # Combine all text for analysis
         all_text = f"{hackathon_name} {' '.join(search_snippets)} {web_content}".lower()
         
-        # Detect hackathon type and domain
-        domain = detect_domain(all_text)
-        
-        # Extract technologies mentioned
-        technologies = detect_technologies(all_text)
-        
-        # Generate intelligent summary
-        summary = generate_summary(hackathon_name, domain, all_text)
-        
-        # Extract timeline information
-        timeline = extract_timeline(all_text)
-        
-        # Generate requirements
-        requirements = generate_requirements(domain, hackathon_name)
-        
-        # Get reference projects
-        reference_projects = get_reference_projects(technologies, domain)
-        
-        # Generate tool guides
-        tool_guides = generate_tool_guides(technologies)
+        with span('analysis.detect'):
+            # Detect hackathon type and domain
+            domain = detect_domain(all_text)
+            
+            # Extract technologies mentioned
+            technologies = detect_technologies(all_text)
+            
+            # Extract timeline information
+            timeline = extract_timeline(all_text)
         
-        # Generate practical tips
-        tips = generate_practical_tips(domain, hackathon_name)
+        with span('analysis.templates'):
+            # Generate intelligent summary
+            summary = generate_summary(hackathon_name, domain, all_text)
+            
+            # Generate requirements
+            requirements = generate_requirements(domain, hackathon_name)
+            
+            # Get reference projects
+            reference_projects = get_reference_projects(technologies, domain)
+            
+            # Generate tool guides
+            tool_guides = generate_tool_guides(technologies)
+            
+            # Generate practical tips
+            tips = generate_practical_tips(domain, hackathon_name)
         
         return {
             'success': True,
+            'domain': domain,
             'analysis': {
                 'summary': summary,
                 'technologies': technologies,
@@ -201,56 +751,61 @@ def analyze_with_smart_templates(hackathon_name, web_content, search_snippets):
         }
         
     except Exception as e:
-        print(f"Analysis error: {str(e)}")
+        logger.exception("Analysis error")
         return {
             'success': False,
             'error': str(e)
         }
 
 
+# Keyword tables are compiled once at import time into single-pass matchers
+DOMAIN_KEYWORDS = {
+    'AI/ML': ['machine learning', 'ai', 'artificial intelligence', 'neural', 'deep learning', 'ml', 'data science'],
+    'Blockchain': ['blockchain', 'ethereum', 'web3', 'crypto', 'defi', 'nft', 'smart contract'],
+    'Cloud': ['cloud', 'aws', 'azure', 'gcp', 'google cloud', 'serverless'],
+    'Mobile': ['mobile', 'ios', 'android', 'react native', 'flutter', 'app development'],
+    'Web Development': ['web', 'frontend', 'backend', 'full stack', 'react', 'node'],
+    'IoT': ['iot', 'internet of things', 'embedded', 'arduino', 'raspberry pi'],
+    'Space Tech': ['space', 'nasa', 'satellite', 'astronomy'],
+    'Social Impact': ['social', 'impact', 'sustainability', 'education', 'healthcare'],
+}
+
+TECH_PATTERNS = {
+    'React': {'keywords': ['react', 'reactjs'], 'difficulty': 'Intermediate', 'desc': 'Popular JavaScript library for building user interfaces with component-based architecture'},
+    'Node.js': {'keywords': ['node', 'nodejs', 'express'], 'difficulty': 'Intermediate', 'desc': 'JavaScript runtime for building scalable server-side applications'},
+    'Python': {'keywords': ['python', 'django', 'flask'], 'difficulty': 'Beginner', 'desc': 'Versatile programming language perfect for rapid prototyping and data processing'},
+    'TensorFlow': {'keywords': ['tensorflow', 'tf'], 'difficulty': 'Advanced', 'desc': 'Machine learning framework for building and training neural networks'},
+    'Docker': {'keywords': ['docker', 'container'], 'difficulty': 'Intermediate', 'desc': 'Containerization platform for consistent deployment across environments'},
+    'MongoDB': {'keywords': ['mongodb', 'mongo'], 'difficulty': 'Beginner', 'desc': 'NoSQL database perfect for flexible, scalable data storage'},
+    'PostgreSQL': {'keywords': ['postgres', 'postgresql', 'sql'], 'difficulty': 'Intermediate', 'desc': 'Powerful relational database with advanced features'},
+    'AWS': {'keywords': ['aws', 'amazon web'], 'difficulty': 'Intermediate', 'desc': 'Cloud platform offering compute, storage, and ML services'},
+    'Firebase': {'keywords': ['firebase'], 'difficulty': 'Beginner', 'desc': 'Backend-as-a-service platform for quick app development'},
+    'Git': {'keywords': ['git', 'github'], 'difficulty': 'Beginner', 'desc': 'Version control system essential for team collaboration'},
+}
+
+DOMAIN_MATCHER = KeywordMatcher(DOMAIN_KEYWORDS)
+TECH_MATCHER = KeywordMatcher({tech: info['keywords'] for tech, info in TECH_PATTERNS.items()})
+
+
 def detect_domain(text):
-    """Detect hackathon domain from text"""
-    domains = {
-        'AI/ML': ['machine learning', 'ai', 'artificial intelligence', 'neural', 'deep learning', 'ml', 'data science'],
-        'Blockchain': ['blockchain', 'ethereum', 'web3', 'crypto', 'defi', 'nft', 'smart contract'],
-        'Cloud': ['cloud', 'aws', 'azure', 'gcp', 'google cloud', 'serverless'],
-        'Mobile': ['mobile', 'ios', 'android', 'react native', 'flutter', 'app development'],
-        'Web Development': ['web', 'frontend', 'backend', 'full stack', 'react', 'node'],
-        'IoT': ['iot', 'internet of things', 'embedded', 'arduino', 'raspberry pi'],
-        'Space Tech': ['space', 'nasa', 'satellite', 'astronomy'],
-        'Social Impact': ['social', 'impact', 'sustainability', 'education', 'healthcare'],
-    }
-    
-    for domain, keywords in domains.items():
-        if any(keyword in text for keyword in keywords):
-            return domain
+    """Detect hackathon domain from text (highest keyword score wins)"""
+    scores = DOMAIN_MATCHER.scores(text)
+    if scores:
+        return scores[0][0]
     
     return 'General Technology'
 
 
 def detect_technologies(text):
-    """Detect technologies mentioned in text"""
-    tech_patterns = {
-        'React': {'keywords': ['react', 'reactjs'], 'difficulty': 'Intermediate', 'desc': 'Popular JavaScript library for building user interfaces with component-based architecture'},
-        'Node.js': {'keywords': ['node', 'nodejs', 'express'], 'difficulty': 'Intermediate', 'desc': 'JavaScript runtime for building scalable server-side applications'},
-        'Python': {'keywords': ['python', 'django', 'flask'], 'difficulty': 'Beginner', 'desc': 'Versatile programming language perfect for rapid prototyping and data processing'},
-        'TensorFlow': {'keywords': ['tensorflow', 'tf'], 'difficulty': 'Advanced', 'desc': 'Machine learning framework for building and training neural networks'},
-        'Docker': {'keywords': ['docker', 'container'], 'difficulty': 'Intermediate', 'desc': 'Containerization platform for consistent deployment across environments'},
-        'MongoDB': {'keywords': ['mongodb', 'mongo'], 'difficulty': 'Beginner', 'desc': 'NoSQL database perfect for flexible, scalable data storage'},
-        'PostgreSQL': {'keywords': ['postgres', 'postgresql', 'sql'], 'difficulty': 'Intermediate', 'desc': 'Powerful relational database with advanced features'},
-        'AWS': {'keywords': ['aws', 'amazon web'], 'difficulty': 'Intermediate', 'desc': 'Cloud platform offering compute, storage, and ML services'},
-        'Firebase': {'keywords': ['firebase'], 'difficulty': 'Beginner', 'desc': 'Backend-as-a-service platform for quick app development'},
-        'Git': {'keywords': ['git', 'github'], 'difficulty': 'Beginner', 'desc': 'Version control system essential for team collaboration'},
-    }
-    
+    """Detect technologies mentioned in text, most mentioned first"""
     detected = []
-    for tech, info in tech_patterns.items():
-        if any(keyword in text for keyword in info['keywords']):
-            detected.append({
-                'name': tech,
-                'description': info['desc'],
-                'difficulty': info['difficulty']
-            })
+    for tech, _ in TECH_MATCHER.scores(text):
+        info = TECH_PATTERNS[tech]
+        detected.append({
+            'name': tech,
+            'description': info['desc'],
+            'difficulty': info['difficulty']
+        })
     
     # Add default technologies if none detected
     if not detected:
@@ -263,17 +818,65 @@ def detect_technologies(text):
     return detected[:6]  # Return top 6
 
 
+# Template tables - built once at import; the generate_* functions below only
+# pick from them, and their results are memoized per (domain / technology)
+SUMMARY_TEMPLATES = {
+    'AI/ML': "{name} is a cutting-edge hackathon focused on artificial intelligence and machine learning innovations. Participants will build intelligent applications using modern ML frameworks and data science tools. This event challenges developers to create AI-powered solutions that solve real-world problems.",
+    'Blockchain': "{name} brings together blockchain enthusiasts to build decentralized applications and Web3 solutions. Teams will explore smart contracts, DeFi protocols, and innovative crypto applications. This hackathon focuses on building the future of decentralized technology.",
+    'Cloud': "{name} challenges participants to build cloud-native applications using modern cloud platforms. Developers will leverage serverless architectures, containerization, and cloud services to create scalable solutions. This event focuses on infrastructure innovation and cloud-first development.",
+    'Space Tech': "{name} invites innovators to solve challenges in space technology and exploration. Teams will work with real NASA data and space-related APIs to build applications that advance our understanding of the universe. This hackathon combines technology with the wonder of space.",
+    'Social Impact': "{name} focuses on using technology to create positive social change. Participants will build solutions addressing education, healthcare, sustainability, and community challenges. This event empowers developers to make a meaningful impact through innovation.",
+}
+DEFAULT_SUMMARY_TEMPLATE = "{name} is an exciting hackathon bringing together innovative developers to build creative technology solutions. Participants will collaborate in teams to create impactful projects within a limited timeframe. This event celebrates creativity, technical skill, and problem-solving."
+
+BASE_REQUIREMENTS = [
+    'Form a team of 2-4 members (or participate solo if allowed)',
+    'Have a GitHub account for code sharing and version control',
+    'Bring your laptop with development environment set up',
+]
+DOMAIN_REQUIREMENTS = {
+    'AI/ML': ['Basic knowledge of Python and machine learning concepts', 'Familiarity with ML frameworks like TensorFlow or PyTorch'],
+    'Blockchain': ['Understanding of blockchain fundamentals and smart contracts', 'Wallet setup for testing (MetaMask recommended)'],
+    'Cloud': ['Basic cloud platform knowledge (AWS/Azure/GCP)', 'Understanding of containerization concepts'],
+    'Mobile': ['Mobile development experience (iOS or Android)', 'Device/emulator for testing'],
+    'Web Development': ['Knowledge of HTML, CSS, and JavaScript', 'Familiarity with modern frameworks'],
+}
+DEFAULT_REQUIREMENTS = ['Enthusiasm to learn and build something amazing!']
+
+BASE_REFERENCE_PROJECTS = [
+    {
+        'title': 'Awesome Hackathon Projects',
+        'description': 'Curated list of impressive hackathon projects with source code and demos',
+        'github_url': 'https://github.com/topics/hackathon',
+        'relevance': 'Browse winning projects from previous hackathons for inspiration and implementation ideas'
+    },
+    {
+        'title': 'Quick Starter Templates',
+        'description': 'Ready-to-use templates for rapid hackathon development',
+        'github_url': 'https://github.com/topics/hackathon-starter',
+        'relevance': 'Bootstrap your project quickly with pre-configured starter templates'
+    },
+]
+
+GENERAL_TIPS = [
+    'Start with the simplest viable product (MVP) - you can always add features later',
+    'Spend the first hour planning your architecture and dividing tasks among team members',
+    'Use version control (Git) from the start to avoid conflicts and enable collaboration',
+    'Test your demo thoroughly before presentation time - practice makes perfect',
+    'Focus on solving one problem really well rather than many problems poorly',
+    'Keep your presentation simple and focused on the problem, solution, and impact',
+    'Don\'t forget to document your code - future you (and judges) will appreciate it',
+]
+DOMAIN_TIPS = {
+    'AI/ML': ['Use pre-trained models to save time - don\'t train from scratch unless necessary', 'Have a simple demo dataset ready to showcase your model\'s capabilities'],
+    'Blockchain': ['Start with testnets to avoid real money transactions during development', 'Use established patterns and audited contracts as starting points'],
+    'Cloud': ['Leverage free tier credits from cloud providers for the hackathon', 'Use Infrastructure-as-Code to make deployment repeatable'],
+}
+
+
 def generate_summary(hackathon_name, domain, text):
     """Generate intelligent summary"""
-    templates = {
-        'AI/ML': f"{hackathon_name} is a cutting-edge hackathon focused on artificial intelligence and machine learning innovations. Participants will build intelligent applications using modern ML frameworks and data science tools. This event challenges developers to create AI-powered solutions that solve real-world problems.",
-        'Blockchain': f"{hackathon_name} brings together blockchain enthusiasts to build decentralized applications and Web3 solutions. Teams will explore smart contracts, DeFi protocols, and innovative crypto applications. This hackathon focuses on building the future of decentralized technology.",
-        'Cloud': f"{hackathon_name} challenges participants to build cloud-native applications using modern cloud platforms. Developers will leverage serverless architectures, containerization, and cloud services to create scalable solutions. This event focuses on infrastructure innovation and cloud-first development.",
-        'Space Tech': f"{hackathon_name} invites innovators to solve challenges in space technology and exploration. Teams will work with real NASA data and space-related APIs to build applications that advance our understanding of the universe. This hackathon combines technology with the wonder of space.",
-        'Social Impact': f"{hackathon_name} focuses on using technology to create positive social change. Participants will build solutions addressing education, healthcare, sustainability, and community challenges. This event empowers developers to make a meaningful impact through innovation.",
-    }
-    
-    return templates.get(domain, f"{hackathon_name} is an exciting hackathon bringing together innovative developers to build creative technology solutions. Participants will collaborate in teams to create impactful projects within a limited timeframe. This event celebrates creativity, technical skill, and problem-solving.")
+    return SUMMARY_TEMPLATES.get(domain, DEFAULT_SUMMARY_TEMPLATE).format(name=hackathon_name)
 
 
 def extract_timeline(text):
@@ -298,113 +901,439 @@ def extract_timeline(text):
     return timeline
 
 
+@lru_cache(maxsize=64)
+def _requirements_for(domain):
+    return (BASE_REQUIREMENTS + DOMAIN_REQUIREMENTS.get(domain, DEFAULT_REQUIREMENTS))[:5]
+
+
 def generate_requirements(domain, hackathon_name):
-    """Generate requirements based on domain"""
-    base_requirements = [
-        'Form a team of 2-4 members (or participate solo if allowed)',
-        'Have a GitHub account for code sharing and version control',
-        'Bring your laptop with development environment set up',
-    ]
-    
-    domain_requirements = {
-        'AI/ML': ['Basic knowledge of Python and machine learning concepts', 'Familiarity with ML frameworks like TensorFlow or PyTorch'],
-        'Blockchain': ['Understanding of blockchain fundamentals and smart contracts', 'Wallet setup for testing (MetaMask recommended)'],
-        'Cloud': ['Basic cloud platform knowledge (AWS/Azure/GCP)', 'Understanding of containerization concepts'],
-        'Mobile': ['Mobile development experience (iOS or Android)', 'Device/emulator for testing'],
-        'Web Development': ['Knowledge of HTML, CSS, and JavaScript', 'Familiarity with modern frameworks'],
-    }
-    
-    requirements = base_requirements + domain_requirements.get(domain, ['Enthusiasm to learn and build something amazing!'])
-    return requirements[:5]
+    """Generate requirements based on domain (memoized - do not mutate the result)"""
+    return _requirements_for(domain)
 
 
-def get_reference_projects(technologies, domain):
-    """Get reference projects based on technologies"""
-    projects = [
-        {
-            'title': 'Awesome Hackathon Projects',
-            'description': 'Curated list of impressive hackathon projects with source code and demos',
-            'github_url': 'https://github.com/topics/hackathon',
-            'relevance': 'Browse winning projects from previous hackathons for inspiration and implementation ideas'
-        },
-        {
-            'title': 'Quick Starter Templates',
-            'description': 'Ready-to-use templates for rapid hackathon development',
-            'github_url': 'https://github.com/topics/hackathon-starter',
-            'relevance': 'Bootstrap your project quickly with pre-configured starter templates'
-        },
+@lru_cache(maxsize=256)
+def _reference_projects_for(tech_name):
+    return BASE_REFERENCE_PROJECTS + [
         {
-            'title': f'{technologies[0]["name"] if technologies else "JavaScript"} Example Projects',
-            'description': f'Real-world projects showcasing {technologies[0]["name"] if technologies else "JavaScript"} best practices',
-            'github_url': f'https://github.com/topics/{technologies[0]["name"].lower().replace(" ", "-") if technologies else "javascript"}',
+            'title': f'{tech_name} Example Projects',
+            'description': f'Real-world projects showcasing {tech_name} best practices',
+            'github_url': f'https://github.com/topics/{tech_name.lower().replace(" ", "-")}',
             'relevance': 'Learn from production-quality code examples and patterns'
         },
     ]
-    
-    return projects
+
+
+def get_reference_projects(technologies, domain):
+    """Get reference projects based on technologies (memoized per top technology)"""
+    return _reference_projects_for(technologies[0]['name'] if technologies else 'JavaScript')
+
+
+@lru_cache(maxsize=256)
+def _tool_guide_for(tech_name):
+    return {
+        'tool_name': tech_name,
+        'quick_start': f"Get started with {tech_name} by installing the required dependencies and following the official quick-start guide. Set up your development environment and create a simple 'Hello World' project to verify everything works.",
+        'key_resources': [
+            f"Official {tech_name} Documentation",
+            f"{tech_name} Tutorial for Beginners",
+            f"Community forums and Stack Overflow for troubleshooting"
+        ],
+        'hackathon_context': f"For the hackathon, focus on using {tech_name} to build your core features quickly. Prioritize functionality over perfection, and leverage existing libraries and frameworks to save time."
+    }
 
 
 def generate_tool_guides(technologies):
-    """Generate tool guides for technologies"""
-    guides = []
-    
-    for tech in technologies[:3]:  # Top 3 technologies
-        guide = {
-            'tool_name': tech['name'],
-            'quick_start': f"Get started with {tech['name']} by installing the required dependencies and following the official quick-start guide. Set up your development environment and create a simple 'Hello World' project to verify everything works.",
-            'key_resources': [
-                f"Official {tech['name']} Documentation",
-                f"{tech['name']} Tutorial for Beginners",
-                f"Community forums and Stack Overflow for troubleshooting"
-            ],
-            'hackathon_context': f"For the hackathon, focus on using {tech['name']} to build your core features quickly. Prioritize functionality over perfection, and leverage existing libraries and frameworks to save time."
+    """Generate tool guides for technologies (each guide memoized per technology)"""
+    return [_tool_guide_for(tech['name']) for tech in technologies[:3]]  # Top 3 technologies
+
+
+@lru_cache(maxsize=64)
+def _tips_for(domain):
+    return (GENERAL_TIPS[:5] + DOMAIN_TIPS.get(domain, []))[:7]
+
+
+def generate_practical_tips(domain, hackathon_name):
+    """Generate practical tips (memoized per domain - do not mutate the result)"""
+    return _tips_for(domain)
+
+
+# Pre-serialized JSON for the template sections. Each section's encoded bytes
+# are cached under the inputs that fully determine it, so a response is
+# assembled by splicing cached fragments instead of re-encoding everything.
+FRAGMENT_KEYS = {
+    'technologies': lambda data: tuple((tech['name'], tech['description']) for tech in data['technologies']),
+    'timeline': lambda data: data['timeline']['current_stage'],
+    'requirements': lambda data: data['domain'],
+    'reference_projects': lambda data: data['technologies'][0]['name'] if data['technologies'] else None,
+    'tool_guides': lambda data: tuple(tech['name'] for tech in data['technologies'][:3]),
+    'tips': lambda data: data['domain'],
+}
+
+fragment_cache = FragmentCache(max_entries=FRAGMENT_CACHE_SIZE)
+
+# Analyses by source-text fingerprint: an unchanged page is not re-analyzed
+analysis_memo = AnalysisCache(max_entries=ANALYSIS_MEMO_SIZE, ttl=ANALYSIS_MEMO_TTL_SECONDS, stale_ttl=0)
+
+
+def render_analysis_json(data):
+    """
+    Encode {"success": true, "data": data} by splicing cached JSON fragments
+    
+    Args:
+        data (dict): Analysis data produced by run_analysis_pipeline
+        
+    Returns:
+        bytes: JSON response body
+    """
+    parts = []
+    for field, value in data.items():
+        key_for = FRAGMENT_KEYS.get(field)
+        # fields= selections may lack the sections the keys are derived from
+        if key_for is not None and 'domain' in data and 'technologies' in data:
+            encoded = fragment_cache.encode(field, key_for(data), value)
+        else:
+            encoded = encode_json(value)
+        parts.append(encode_json(field) + b':' + encoded)
+    return b'{"success":true,"data":{' + b','.join(parts) + b'}}'
+
+
+def content_fingerprint(*parts):
+    """
+    Stable hash of text/bytes parts (ETags, unchanged-source detection)
+    
+    Returns:
+        str: 32 hex characters
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()[:32]
+
+
+def warm_up():
+    """
+    Exercise detection, templates and fragment encoding without any network
+    traffic, so the first real requests don't pay for it. The production
+    server runs this once in the parent process before forking workers.
+    
+    Returns:
+        int: Number of sample analyses rendered
+    """
+    tech_text = ' '.join(keyword for info in TECH_PATTERNS.values() for keyword in info['keywords'])
+    for tech in TECH_PATTERNS:
+        _tool_guide_for(tech)
+        _reference_projects_for(tech)
+
+    rendered = 0
+    # The last pass has no keywords at all, so it covers the default technologies
+    for domain, keywords in list(DOMAIN_KEYWORDS.items()) + [('General Technology', [])]:
+        text = f"{' '.join(keywords)} {tech_text}" if keywords else ''
+        technologies = detect_technologies(text)
+        data = {
+            'hackathon_name': 'warmup',
+            'source_url': None,
+            'analyzed_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'domain': domain,
+            'summary': generate_summary('warmup', domain, text),
+            'technologies': technologies,
+            'timeline': extract_timeline(text),
+            'requirements': generate_requirements(domain, 'warmup'),
+            'reference_projects': get_reference_projects(technologies, domain),
+            'tool_guides': generate_tool_guides(technologies),
+            'tips': generate_practical_tips(domain, 'warmup'),
         }
-        guides.append(guide)
+        render_analysis_json(data)
+        rendered += 1
+    return rendered
+
+
+def run_analysis_pipeline(hackathon_name, progress=None, resolution=None):
+    """
+    Run the full search -> scrape -> analyze pipeline for one hackathon
+    within a REQUEST_BUDGET_SECONDS latency budget
     
-    return guides
+    Args:
+        hackathon_name (str): Name of the hackathon
+        progress (callable): Optional progress(stage, data) hook called as
+                             each stage finishes, with its partial results
+        resolution (dict): The name's catalog match (resolve_hackathon_name),
+                           None for names not in the catalog
+        
+    Returns:
+        dict: {'success': True, 'data': {...}, 'degraded': bool} or
+              {'success': False, 'error': str, 'status': int}.
+              degraded is True when the search circuit was open or failed,
+              or the budget ran out before the page was fully scraped.
+    """
+    with deadline_scope(REQUEST_BUDGET_SECONDS) as deadline:
+        return _run_pipeline_stages(hackathon_name, progress, resolution, deadline)
 
 
-def generate_practical_tips(domain, hackathon_name):
-    """Generate practical tips"""
-    general_tips = [
-        'Start with the simplest viable product (MVP) - you can always add features later',
-        'Spend the first hour planning your architecture and dividing tasks among team members',
-        'Use version control (Git) from the start to avoid conflicts and enable collaboration',
-        'Test your demo thoroughly before presentation time - practice makes perfect',
-        'Focus on solving one problem really well rather than many problems poorly',
-        'Keep your presentation simple and focused on the problem, solution, and impact',
-        'Don\'t forget to document your code - future you (and judges) will appreciate it',
-    ]
+def _run_pipeline_stages(hackathon_name, progress, resolution, deadline):
+    logger.info("Analyzing hackathon", extra={'hackathon_name': hackathon_name})
+    index_key = resolution['key'] if resolution is not None else normalize_name(hackathon_name)
+    
+    # Step 1: Search for hackathon page (FREE - DuckDuckGo HTML)
+    # Names in the catalog (official URL) or already in the local index skip
+    # the external search
+    known_results, known_source = None, None
+    if resolution is not None and resolution['entry']['url']:
+        known_results, known_source = catalog.search_results(resolution), 'catalog'
+    elif hackathon_index is not None:
+        with span('index.lookup'):
+            # While the search circuit is open, stored results of any age beat a fallback
+            max_age = None if search_breaker.state == CircuitBreaker.CLOSED else float('inf')
+            known_results, known_source = hackathon_index.known_results(index_key, max_age=max_age), 'index'
+    
+    if known_results:
+        search_result = {'success': True, 'results': known_results, 'source': known_source}
+    else:
+        with span('search'):
+            search_result = search_hackathon_page(hackathon_name)
+    
+    if not search_result['success']:
+        return {
+            'success': False,
+            'error': 'Failed to find hackathon information online',
+            'status': 404
+        }
+    
+    search_results = search_result['results']
+    if progress:
+        progress('search', {'results': search_results, 'source': search_result.get('source')})
+    
+    # Step 2: Scrape the top results, hedged (FREE - streaming HTML parser)
+    # Skipped when the search left too little of the budget - snippets still work
+    degraded = search_result.get('degraded', False)
+    web_content = ""
+    source_url = resolve_result_link(search_results[0]['link']) if search_results else None
+    if search_results:
+        if deadline.remaining() - ANALYSIS_RESERVE_SECONDS < MIN_SCRAPE_SECONDS:
+            degraded = True
+        else:
+            with span('scrape'):
+                web_content, scraped_url = scrape_top_results(search_results)
+            source_url = scraped_url or source_url
+            degraded = degraded or deadline.remaining() <= ANALYSIS_RESERVE_SECONDS
+    if progress:
+        progress('scrape', {
+            'source_url': source_url,
+            'content_length': len(web_content)
+        })
     
-    domain_tips = {
-        'AI/ML': ['Use pre-trained models to save time - don\'t train from scratch unless necessary', 'Have a simple demo dataset ready to showcase your model\'s capabilities'],
-        'Blockchain': ['Start with testnets to avoid real money transactions during development', 'Use established patterns and audited contracts as starting points'],
-        'Cloud': ['Leverage free tier credits from cloud providers for the hackathon', 'Use Infrastructure-as-Code to make deployment repeatable'],
+    # Step 3: Analyze with smart templates (FREE - No AI cost!)
+    # Skipped when the source text is unchanged since an earlier run - the
+    # earlier result (and its analyzed_at / ETag) is reused as is
+    snippets = [r['snippet'] for r in search_results]
+    source_fingerprint = content_fingerprint(hackathon_name, source_url or '', *snippets, web_content)
+    memo, _ = analysis_memo.lookup(source_fingerprint)
+    if memo is not None:
+        data, etag = memo['data'], memo['etag']
+    else:
+        try:
+            with span('analysis'):
+                analysis_result = run_cpu(
+                    analyze_with_smart_templates, hackathon_name, web_content, snippets
+                )
+        except OffloadError as e:
+            logger.warning("Analysis not run", extra={'hackathon_name': hackathon_name, 'error': str(e)})
+            return {
+                'success': False,
+                'error': 'Analysis capacity exhausted, please retry',
+                'status': 503
+            }
+        
+        if not analysis_result['success']:
+            return {
+                'success': False,
+                'error': 'Failed to analyze hackathon',
+                'status': 500
+            }
+        
+        data = {
+            'hackathon_name': hackathon_name,
+            'source_url': source_url,
+            'analyzed_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'domain': analysis_result['domain'],
+            **analysis_result['analysis']
+        }
+        etag = content_fingerprint(render_analysis_json(data))
+        analysis_memo.set(source_fingerprint, {'data': data, 'etag': etag})
+    
+    if progress:
+        progress('analysis', {'technologies': data.get('technologies')})
+    
+    # Only real search hits and catalog entries are indexed - fallbacks would
+    # hide the name from future searches
+    if hackathon_index is not None and search_result.get('source') in ('search', 'catalog'):
+        try:
+            with span('index.add'):
+                hackathon_index.add(
+                    index_key,
+                    hackathon_name,
+                    search_results,
+                    web_content,
+                    data['domain'],
+                    [tech['name'] for tech in data['technologies']]
+                )
+        except Exception as e:
+            logger.warning("Index update error", extra={'error': str(e)})
+    
+    logger.info("Analysis complete", extra={
+        'hackathon_name': hackathon_name,
+        'results': len(search_results),
+        'content_length': len(web_content),
+        'degraded': degraded,
+        'reused': memo is not None
+    })
+    return {
+        'success': True,
+        'degraded': degraded,
+        'etag': etag,
+        'data': data
     }
+
+
+def run_pipeline_shared(hackathon_name, resolution, flight_key, progress=None):
+    """
+    Run the pipeline once for all concurrent callers with the same flight key
     
-    tips = general_tips[:5] + domain_tips.get(domain, [])
-    return tips[:7]
+    Every caller waiting on the run (not only the one that started it) gets
+    its stage events through its own progress hook.
+    
+    Returns:
+        dict: Pipeline result (see run_analysis_pipeline)
+    """
+    result, _ = pipeline_flight.do(
+        flight_key,
+        lambda: run_analysis_pipeline(
+            hackathon_name, progress=partial(pipeline_flight.publish, flight_key), resolution=resolution
+        ),
+        progress=progress,
+    )
+    return result
+
+
+def analyze_cached(hackathon_name, progress=None, fields=None):
+    """
+    Run the pipeline through the result cache
+    
+    A fields= selection is cut from the full analysis, which is cached (and
+    indexed) like any other: the upstream fetches dominate the cost, and
+    repeats then get a stable body and ETag.
+    
+    Spellings of one catalog hackathon share a cache entry; the name and
+    summary in the result are always those of the caller's spelling.
+    
+    Returns:
+        tuple: (pipeline result dict, cache state 'fresh'/'stale'/'miss')
+    """
+    resolution, cache_key = resolve_hackathon_name(hackathon_name)
+    popularity.record(cache_key, hackathon_name)
+    
+    load = partial(run_pipeline_shared, hackathon_name, resolution, cache_key)
+    
+    # Stage events only go to a caller that waits for the run; the background
+    # refresh of a stale entry would report to a job that has already finished
+    result, cache_state = analysis_cache.get_or_load(cache_key, partial(load, progress), refresh_loader=load)
+    if result['success'] and result['data']['hackathon_name'] != hackathon_name:
+        # Filled (or coalesced) under another spelling - the ETag follows the new body
+        data = result['data']
+        result = {**result, 'etag': None, 'data': {
+            **data,
+            'hackathon_name': hackathon_name,
+            'summary': generate_summary(hackathon_name, data['domain'], '')
+        }}
+    if fields is not None and result['success']:
+        # The stored ETag is the full body's - the route derives one from the selection
+        result = {**result, 'etag': None, 'data': select_fields(result['data'], fields)}
+    return result, cache_state
+
+
+def prewarm_refresh(hackathon_name):
+    """
+    Re-analyze a name off the request path and store it in the cache
+    
+    Upstream requests made here go through prewarm_limiter. The run has a
+    flight key of its own, so a user request never joins it and waits at
+    the prewarm rates - it runs its own pipeline unthrottled instead.
+    
+    Returns:
+        bool: True when a fresh result was stored
+    """
+    resolution, cache_key = resolve_hackathon_name(hackathon_name)
+    start_request(f'prewarm-{uuid.uuid4().hex[:12]}')
+    token = throttle_var.set(prewarm_limiter)
+    try:
+        result = analysis_cache.refresh(
+            cache_key, partial(run_pipeline_shared, hackathon_name, resolution, f'prewarm:{cache_key}')
+        )
+    finally:
+        throttle_var.reset(token)
+    return analysis_cache.cacheable(result)
+
 
+# Popular names are kept warm by a background thread (per worker process)
+prewarmer = Prewarmer(
+    refresh=prewarm_refresh,
+    expires_in=analysis_cache.expires_in,
+    normalize=normalize_hackathon_name,
+    seeds=PREWARM_NAMES,
+    tracker=popularity,
+    limiter=prewarm_limiter,
+    pace_host=urlparse(SEARCH_URL).netloc.lower(),
+    interval=PREWARM_INTERVAL_SECONDS,
+    refresh_ahead=PREWARM_REFRESH_AHEAD_SECONDS,
+    top_n=PREWARM_TOP_N,
+    min_score=PREWARM_MIN_LOOKUPS,
+    max_per_cycle=PREWARM_MAX_PER_CYCLE,
+)
 
-@app.route('/api/analyze-hackathon', methods=['POST'])
+
+def run_analysis_job(job, fields=None):
+    """Background job body - stage events are streamed through job.emit"""
+    result, cache_state = analyze_cached(job.hackathon_name, progress=job.emit, fields=fields)
+    if cache_state != 'miss':
+        job.emit('cache', {'state': cache_state})
+    return result
+
+
+@app.route('/api/analyze-hackathon', methods=['GET', 'POST'])
 def analyze_hackathon():
     """
     Main endpoint to analyze a hackathon (FREE VERSION - No paid APIs!)
     
     Expected JSON body:
     {
-        "hackathon_name": "Name of the hackathon"
+        "hackathon_name": "Name of the hackathon",
+        "fields": ["timeline"],   (optional - only these sections, see ANALYSIS_FIELDS)
+        "async": false   (optional - true returns a job id right away)
     }
     
+    GET /api/analyze-hackathon?hackathon_name=...&fields=timeline,tips works
+    the same (no async).
+    Responses carry an ETag; a request whose If-None-Match matches it gets
+    304 Not Modified with no body.
+    
     Returns:
     {
         "success": true/false,
         "data": { ... analyzed data ... },
         "error": "error message if any"
     }
+    
+    With "async": true the response is 202 with {"success": true, "job_id": ...};
+    follow it at /api/jobs/<id> or /api/jobs/<id>/events (Server-Sent Events).
     """
     try:
-        data = request.get_json()
+        if request.method == 'GET':
+            data = {
+                'hackathon_name': request.args.get('hackathon_name'),
+                'fields': request.args.get('fields')
+            }
+        else:
+            data = request.get_json()
         hackathon_name = data.get('hackathon_name')
         
         if not hackathon_name:
@@ -413,60 +1342,260 @@ def analyze_hackathon():
                 'error': 'Hackathon name is required'
             }), 400
         
-        print(f"✨ Analyzing hackathon: {hackathon_name} (FREE VERSION)")
+        try:
+            fields = parse_fields(data.get('fields'))
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
         
-        # Step 1: Search for hackathon page (FREE - DuckDuckGo HTML)
-        print("Step 1: Searching web (FREE)...")
-        search_result = search_hackathon_page(hackathon_name)
+        if data.get('async'):
+            try:
+                job = job_manager.submit(hackathon_name, partial(run_analysis_job, fields=fields))
+            except QueueFull as e:
+                logger.warning("Job rejected", extra={'hackathon_name': hackathon_name, 'error': str(e)})
+                response = jsonify({
+                    'success': False,
+                    'error': 'Too many analyses in progress, try again shortly'
+                })
+                response.headers['Retry-After'] = '5'
+                return response, 503
+            return jsonify({
+                'success': True,
+                'job_id': job.id,
+                'status': job.status,
+                'status_url': f'/api/jobs/{job.id}',
+                'events_url': f'/api/jobs/{job.id}/events'
+            }), 202
         
-        if not search_result['success']:
+        result, cache_state = analyze_cached(hackathon_name, fields=fields)
+
+        if not result['success']:
             return jsonify({
                 'success': False,
-                'error': 'Failed to find hackathon information online'
-            }), 404
+                'error': result['error']
+            }), result['status']
+
+        # Template sections are spliced in from pre-encoded JSON fragments
+        body = None
+        etag = result.get('etag')
+        if etag is None:
+            body = render_analysis_json(result['data'])
+            etag = content_fingerprint(body)
         
-        search_results = search_result['results']
+        if request.if_none_match.contains_weak(etag):
+            # The client already has this exact analysis
+            response = Response(status=304)
+        else:
+            response = Response(body or render_analysis_json(result['data']), mimetype='application/json')
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        response.headers['X-Cache'] = {'fresh': 'HIT', 'stale': 'STALE'}.get(cache_state, 'MISS')
+        if result.get('degraded'):
+            response.headers['X-Degraded'] = '1'
+        return response
         
-        # Step 2: Scrape the top result (FREE - BeautifulSoup)
-        print("Step 2: Scraping hackathon page (FREE)...")
-        web_content = ""
-        if search_results:
-            top_url = search_results[0]['link']
-            web_content = scrape_hackathon_page(top_url)
+    except Exception as e:
+        logger.exception("Error in analyze_hackathon")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@app.route('/api/analyze-hackathons', methods=['POST'])
+def analyze_hackathons():
+    """
+    Batch endpoint - analyze many hackathons concurrently
+    
+    Expected JSON body:
+    {
+        "hackathon_names": ["MLH Hackathon 2025", "TreeHacks", ...]
+    }
+    
+    Returns:
+    {
+        "success": true,
+        "results": [
+            {"hackathon_name": "...", "success": true, "degraded": false, "data": { ... }},
+            {"hackathon_name": "...", "success": false, "error": "..."}
+        ]
+    }
+    
+    Results are returned in input order. Each lookup runs on a bounded
+    worker pool, so the batch takes about as long as the slowest item.
+    "degraded" marks items built from fallback data (search circuit open,
+    budget spent) - what X-Degraded says for a single analysis.
+    """
+    try:
+        data = request.get_json()
+        hackathon_names = data.get('hackathon_names')
         
-        # Step 3: Analyze with smart templates (FREE - No AI cost!)
-        print("Step 3: Analyzing with smart templates (FREE)...")
-        snippets = [r['snippet'] for r in search_results]
-        analysis_result = analyze_with_smart_templates(hackathon_name, web_content, snippets)
+        if not isinstance(hackathon_names, list) or not hackathon_names:
+            return jsonify({
+                'success': False,
+                'error': 'hackathon_names must be a non-empty list'
+            }), 400
         
-        if not analysis_result['success']:
+        if len(hackathon_names) > BATCH_MAX_ITEMS:
             return jsonify({
                 'success': False,
-                'error': 'Failed to analyze hackathon'
-            }), 500
+                'error': f'At most {BATCH_MAX_ITEMS} hackathons per batch'
+            }), 400
         
-        # Step 4: Return comprehensive response
-        response_data = {
-            'success': True,
-            'data': {
-                'hackathon_name': hackathon_name,
-                'source_url': search_results[0]['link'] if search_results else None,
-                'analyzed_at': time.strftime('%Y-%m-%d %H:%M:%S'),
-                **analysis_result['analysis']
-            }
-        }
+        logger.info("Batch analyzing hackathons", extra={'count': len(hackathon_names)})
+        
+        futures = []
+        for name in hackathon_names:
+            if isinstance(name, str) and name.strip():
+                # copy_context keeps the request id on the worker thread's log lines
+                futures.append(batch_executor.submit(contextvars.copy_context().run, analyze_cached, name))
+            else:
+                futures.append(None)
+        
+        results = []
+        for name, future in zip(hackathon_names, futures):
+            if future is None:
+                results.append({
+                    'hackathon_name': name,
+                    'success': False,
+                    'error': 'Hackathon name is required'
+                })
+                continue
+            
+            try:
+                result, _ = future.result()
+            except Exception as e:
+                logger.exception("Batch item error", extra={'hackathon_name': name})
+                result = {'success': False, 'error': str(e)}
+            
+            if result['success']:
+                results.append({
+                    'hackathon_name': name,
+                    'success': True,
+                    'degraded': bool(result.get('degraded')),
+                    'data': result['data']
+                })
+            else:
+                results.append({'hackathon_name': name, 'success': False, 'error': result['error']})
         
-        print("✅ Analysis complete (100% FREE)!")
-        return jsonify(response_data), 200
+        return jsonify({
+            'success': True,
+            'results': results
+        }), 200
         
     except Exception as e:
-        print(f"❌ Error in analyze_hackathon: {str(e)}")
+        logger.exception("Error in analyze_hackathons")
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
 
 
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """Poll a background analysis job (status, stages so far, partial data, result)"""
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({
+            'success': False,
+            'error': 'Job not found'
+        }), 404
+    
+    return jsonify({
+        'success': True,
+        'job': job.to_dict()
+    }), 200
+
+
+@app.route('/api/jobs/<job_id>/events', methods=['GET'])
+def stream_job_events(job_id):
+    """
+    Server-Sent Events stream of a job's progress
+    
+    Emits one event per finished stage (search, scrape, analysis) and a final
+    "completed" or "failed" event, then closes. Reconnecting clients resume
+    from the Last-Event-ID header.
+    """
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({
+            'success': False,
+            'error': 'Job not found'
+        }), 404
+    
+    try:
+        last_event_id = int(request.headers.get('Last-Event-ID', 0))
+    except ValueError:
+        last_event_id = 0
+    
+    return Response(
+        sse_events(job, last_event_id),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+@app.route('/api/search-hackathons', methods=['GET'])
+def search_hackathons():
+    """
+    Ranked full-text search over every hackathon analyzed so far
+    (local SQLite FTS5 index - no upstream traffic)
+    
+    Query parameters:
+        q: Search text, e.g. "blockchain defi"
+        limit: Max results (default 10, max 50)
+    """
+    query = request.args.get('q', '').strip()
+    if not query:
+        return jsonify({
+            'success': False,
+            'error': 'Query parameter q is required'
+        }), 400
+    
+    if hackathon_index is None:
+        return jsonify({
+            'success': False,
+            'error': 'Hackathon index is disabled'
+        }), 503
+    
+    try:
+        limit = max(1, min(int(request.args.get('limit', 10)), 50))
+    except ValueError:
+        limit = 10
+    
+    with span('index.search'):
+        results = hackathon_index.search(query, limit=limit)
+    
+    return jsonify({
+        'success': True,
+        'query': query,
+        'results': results
+    }), 200
+
+
+@app.route('/api/cache/stats', methods=['GET'])
+def cache_stats():
+    """Hit/miss/eviction counters for the analysis result cache"""
+    return jsonify({
+        'success': True,
+        'cache': analysis_cache.stats(),
+        'coalescing': pipeline_flight.stats(),
+        'fragments': fragment_cache.stats(),
+        'analysis_memo': analysis_memo.stats(),
+        'compression': compressor.stats(),
+        'catalog': catalog.stats(),
+        'prewarm': prewarmer.stats()
+    }), 200
+
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Prometheus metrics (text exposition format)"""
+    return Response(REGISTRY.render(), mimetype=CONTENT_TYPE.split(';')[0], content_type=CONTENT_TYPE)
+
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
@@ -474,7 +1603,12 @@ def health_check():
         'status': 'healthy',
         'service': 'Smart Hackathon Analyzer (FREE)',
         'version': '2.0.0-free',
-        'cost': '$0.00 - Completely Free!'
+        'cost': '$0.00 - Completely Free!',
+        'upstreams': {
+            'search': {**search_timeout.stats(), 'circuit': search_breaker.stats()},
+            'scrape': scrape_timeout.stats()
+        },
+        'cpu_pool': cpu_pool.stats() if CPU_OFFLOAD else None
     }), 200
 
 
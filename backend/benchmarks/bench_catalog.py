@@ -0,0 +1,176 @@
+"""
+Microbenchmark: hackathon name resolution at 10k and 100k catalog entries
+
+Builds synthetic catalogs (made-up names with aliases) and times
+HackathonCatalog.resolve(name, allow_fuzzy=True) per query kind:
+- exact: the display name as listed
+- variant: spacing, case, punctuation and a year changed ("Zorb Lax Hacks 2026!")
+- typo: one or two edits in the name
+- miss: names not in the catalog
+and, for comparison, the linear substring scan the old fallback lookup did
+(one `key in name` check per entry). "correct" counts queries resolved to
+the entry they were made from, "wrong" those resolved to any other entry
+(for misses: resolved at all).
+
+Usage:
+    cd backend
+    python benchmarks/bench_catalog.py
+    python benchmarks/bench_catalog.py --sizes 10000 100000 --queries 2000
+"""
+
+import argparse
+import os
+import random
+import string
+import sys
+import time
+from functools import partial
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from catalog import HackathonCatalog, normalize_name, split_name  # noqa: E402
+
+# Consonant + vowel (+ optional coda) syllables: 'ba', 'kor', 'vix', ...
+SYLLABLES = [c + v + coda for c in 'bcdfghjklmnprstvwz' for v in 'aeiou' for coda in ('', 'n', 'r', 'x')]
+SUFFIXES = ['Hacks', 'Hack', 'Hackathon', 'Jam', 'Code', 'Fest', 'Con', 'Build', '']
+
+
+def make_entries(size, seed=7):
+    """Distinct synthetic entries: name, one or two aliases and a URL"""
+    rng = random.Random(seed)
+    entries = []
+    seen = set()
+    while len(entries) < size:
+        stem = ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).capitalize()
+        suffix = rng.choice(SUFFIXES)
+        name = f'{stem} {suffix}'.strip()
+        # Names the catalog cannot tell apart ("Bako Hackathon" and "Bako")
+        # would make "correct" depend on insertion order
+        form = ''.join(split_name(name)[0])
+        if form in seen:
+            continue
+        seen.add(form)
+        aliases = [f'{stem}{suffix}']
+        acronym = ''.join(word[0] for word in name.split()).upper() + stem[-2:].upper()
+        if acronym.lower() not in seen:
+            seen.add(acronym.lower())
+            aliases.append(acronym)
+        entries.append({
+            'name': name,
+            'aliases': aliases,
+            'url': f'https://{stem.lower()}.example.org',
+        })
+    return entries
+
+
+def typo(name, rng, edits):
+    chars = list(name)
+    for _ in range(edits):
+        position = rng.randrange(1, len(chars))
+        op = rng.choice(('swap', 'drop', 'replace'))
+        if op == 'swap' and position < len(chars) - 1:
+            chars[position], chars[position + 1] = chars[position + 1], chars[position]
+        elif op == 'drop':
+            del chars[position]
+        else:
+            chars[position] = rng.choice(string.ascii_lowercase)
+    return ''.join(chars)
+
+
+def make_queries(entries, count, seed=11):
+    """Queries per kind: (query strings, name of the entry each should resolve to)"""
+    rng = random.Random(seed)
+    picks = [rng.choice(entries)['name'] for _ in range(count)]
+    variants = []
+    for name in picks:
+        stem = name.split()[0]
+        cut = rng.randint(2, max(2, len(stem) - 2))
+        spaced = f'{stem[:cut]} {stem[cut:]}{name[len(stem):]}'
+        variants.append(f'  {spaced.upper() if rng.random() < 0.5 else spaced} {rng.randint(2015, 2030)}! ')
+    return {
+        'exact': (picks, picks),
+        'variant': (variants, picks),
+        'typo': ([typo(name, rng, 1 if len(name) < 12 else 2) for name in picks], picks),
+        'miss': ([f'Unlisted {rng.randint(0, 10 ** 6)} Summit' for _ in range(count)], [None] * count),
+    }
+
+
+def accuracy(resolve, queries, expected):
+    """(correct, wrong) fractions - wrong is a resolution to another entry"""
+    correct = wrong = 0
+    for query, name in zip(queries, expected):
+        resolution = resolve(query)
+        if resolution is None:
+            continue
+        if resolution['entry']['name'] == name:
+            correct += 1
+        else:
+            wrong += 1
+    return correct / len(queries), wrong / len(queries)
+
+
+def time_per_call(func, queries, repeat=3):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for query in queries:
+            func(query)
+        elapsed = (time.perf_counter() - started) / len(queries)
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def latency_percentiles(func, queries):
+    samples = []
+    for query in queries:
+        started = time.perf_counter()
+        func(query)
+        samples.append(time.perf_counter() - started)
+    samples.sort()
+    return samples[len(samples) // 2], samples[int(len(samples) * 0.99)]
+
+
+def linear_scan(entries):
+    """The old fallback: substring check of every known key against the name"""
+    keys = [normalize_name(entry['name']) for entry in entries]
+
+    def lookup(name):
+        name_lower = name.lower()
+        for key in keys:
+            if key in name_lower:
+                return key
+        return None
+    return lookup
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--queries', type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'entries':>8} {'kind':>8} {'mean':>10} {'p50':>10} {'p99':>10} {'correct':>8} {'wrong':>7}")
+    for size in args.sizes:
+        entries = make_entries(size)
+        started = time.perf_counter()
+        catalog = HackathonCatalog(entries)
+        build = time.perf_counter() - started
+        resolve = partial(catalog.resolve, allow_fuzzy=True)
+
+        for kind, (queries, expected) in make_queries(entries, args.queries).items():
+            mean = time_per_call(resolve, queries)
+            p50, p99 = latency_percentiles(resolve, queries)
+            correct, wrong = accuracy(resolve, queries, expected)
+            print(f"{size:>8} {kind:>8} {mean * 1e6:>8.1f}us {p50 * 1e6:>8.1f}us {p99 * 1e6:>8.1f}us "
+                  f"{correct:>8.1%} {wrong:>7.1%}")
+
+        linear = linear_scan(entries)
+        queries = make_queries(entries, min(args.queries, 200))['miss'][0]
+        print(f"{size:>8} {'linear':>8} {time_per_call(linear, queries, repeat=1) * 1e6:>8.1f}us"
+              f"   (old substring scan, miss)")
+        print(f"{size:>8} {'build':>8} {build * 1e3:>8.0f}ms   ({catalog.stats()['forms']} forms, "
+              f"{catalog.stats()['posting_lists']} posting lists)")
+
+
+if __name__ == '__main__':
+    main()
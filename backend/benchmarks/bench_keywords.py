@@ -0,0 +1,88 @@
+"""
+Microbenchmark: keyword detection throughput
+
+Compares three ways of scanning analysis text on 5 KB and 500 KB inputs:
+- substring: the old `keyword in text` check (existence only, stops at the
+  first hit, and matches 'ai' inside 'maintain')
+- count: `text.count(keyword)` per keyword - what scoring by substring would
+  cost, one full scan per keyword
+- single-pass: the precompiled trie-regex KeywordMatcher, one scan per table
+  with word boundaries and per-keyword counts
+
+Usage:
+    cd backend
+    python benchmarks/bench_keywords.py
+"""
+
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from app import DOMAIN_KEYWORDS, DOMAIN_MATCHER, TECH_MATCHER, TECH_PATTERNS  # noqa: E402
+
+WORDS = (
+    'hackathon build team prize judges demo submission maintain platform '
+    'students developers innovation weekend mentors workshop sponsors api '
+    'react python machine learning cloud docker github blockchain space'
+).split()
+
+
+def make_text(size, seed=42):
+    """Random lowercase text of roughly `size` characters"""
+    rng = random.Random(seed)
+    words = []
+    length = 0
+    while length < size:
+        word = rng.choice(WORDS)
+        words.append(word)
+        length += len(word) + 1
+    return ' '.join(words)[:size]
+
+
+def substring_scan(text):
+    """The previous implementation: one `in` scan per keyword"""
+    domain = next(
+        (d for d, keywords in DOMAIN_KEYWORDS.items() if any(k in text for k in keywords)),
+        'General Technology'
+    )
+    techs = [t for t, info in TECH_PATTERNS.items() if any(k in text for k in info['keywords'])]
+    return domain, techs
+
+
+def substring_count(text):
+    """Per-keyword hit counts via one str.count scan per keyword"""
+    domain_counts = {k: text.count(k) for keywords in DOMAIN_KEYWORDS.values() for k in keywords}
+    tech_counts = {k: text.count(k) for info in TECH_PATTERNS.values() for k in info['keywords']}
+    return domain_counts, tech_counts
+
+
+def single_pass(text):
+    """Precompiled matchers: one regex pass per table, ranked by score"""
+    return DOMAIN_MATCHER.scores(text), TECH_MATCHER.scores(text)
+
+
+def bench(func, text, min_time=0.5):
+    timer = timeit.Timer(lambda: func(text))
+    number, elapsed = timer.autorange()
+    while elapsed < min_time:
+        number *= 2
+        elapsed = timer.timeit(number)
+    per_call = elapsed / number
+    return per_call, len(text) / per_call / 1e6
+
+
+def main():
+    print(f"{'input':>8} {'method':>14} {'per call':>12} {'MB/s':>10}")
+    for size in (5 * 1024, 500 * 1024):
+        text = make_text(size)
+        for name, func in (('substring', substring_scan), ('count', substring_count),
+                           ('single-pass', single_pass)):
+            per_call, mb_per_s = bench(func, text)
+            print(f"{size // 1024:>6}KB {name:>14} {per_call * 1e6:>10.1f}us {mb_per_s:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
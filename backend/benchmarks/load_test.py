@@ -0,0 +1,251 @@
+"""
+Offline load test for /api/analyze-hackathon
+
+Starts the local stand-in (benchmarks/standin.py) in place of DuckDuckGo and
+the hackathon sites, serves the Flask app on a local port, fires concurrent
+POSTs at it and reports:
+- p50/p95/p99/max latency and throughput
+- per-stage time for search, scrape and analysis
+- status code counts
+
+Results are written as JSON so two runs can be compared.
+
+Usage:
+    cd backend
+    python benchmarks/load_test.py --requests 200 --concurrency 20 --output before.json
+    ... change something ...
+    python benchmarks/load_test.py --requests 200 --concurrency 20 --output after.json
+    python benchmarks/load_test.py --compare before.json after.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from standin import StandinConfig, StandinServer  # noqa: E402
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of an unsorted list"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def summarize(values):
+    """Latency summary in milliseconds"""
+    if not values:
+        return {'count': 0}
+    return {
+        'count': len(values),
+        'mean_ms': round(sum(values) / len(values) * 1000, 3),
+        'p50_ms': round(percentile(values, 50) * 1000, 3),
+        'p95_ms': round(percentile(values, 95) * 1000, 3),
+        'p99_ms': round(percentile(values, 99) * 1000, 3),
+        'max_ms': round(max(values) * 1000, 3),
+    }
+
+
+class StageTimer:
+    """
+    Records the durations span() reports for the given pipeline stages
+
+    Taps the hackathon_stage_duration_seconds histogram instead of wrapping
+    the stage functions, so the app's own functions stay picklable for the
+    CPU offload pool.
+    """
+
+    def __init__(self, stages):
+        self.stages = set(stages)
+        self.samples = defaultdict(list)
+        self.lock = threading.Lock()
+
+    def attach(self, histogram):
+        observe = histogram.observe
+
+        def recording(value, **labels):
+            observe(value, **labels)
+            stage = labels.get('stage')
+            if stage in self.stages:
+                with self.lock:
+                    self.samples[stage].append(value)
+        histogram.observe = recording
+
+
+def run(args):
+    config = StandinConfig(
+        search_latency=args.search_latency / 1000,
+        page_latency=args.page_latency / 1000,
+        page_size=args.page_size,
+        error_rate=args.error_rate,
+        site_hosts=args.site_hosts,
+        seed=args.seed,
+        slow_page_rate=args.slow_page_rate,
+        slow_page_latency=args.slow_page_latency / 1000,
+    )
+
+    with StandinServer(config) as standin:
+        # The backend reads its settings at import time
+        os.environ['HACKATHON_SEARCH_URL'] = standin.search_url
+        # Background refreshes would add upstream traffic nobody asked for
+        os.environ['HACKATHON_PREWARM'] = '0'
+        if not args.cache:
+            os.environ['HACKATHON_CACHE_SIZE'] = '0'
+            os.environ.pop('HACKATHON_CACHE_DB', None)
+            os.environ['HACKATHON_INDEX_DB'] = ''
+
+        import requests
+        from werkzeug.serving import make_server
+
+        import app as backend
+
+        from observability import STAGE_DURATION
+
+        timer = StageTimer(['search', 'scrape', 'analysis'])
+        timer.attach(STAGE_DURATION)
+
+        logging.getLogger('werkzeug').setLevel(logging.WARNING)
+        server = make_server('127.0.0.1', 0, backend.app, threaded=True)
+        server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+        server_thread.start()
+        endpoint = f'http://127.0.0.1:{server.server_port}/api/analyze-hackathon'
+
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=args.concurrency)
+        session.mount('http://', adapter)
+
+        def one_request(index):
+            name = f'{args.name} {index % args.distinct}' if args.distinct else f'{args.name} {index}'
+            started = time.perf_counter()
+            try:
+                response = session.post(endpoint, json={'hackathon_name': name}, timeout=120)
+                status = response.status_code
+            except Exception:
+                status = 'error'
+            return time.perf_counter() - started, status
+
+        # Quiet the per-request progress logs while under load
+        logging.getLogger('hackathon').setLevel(logging.WARNING)
+        try:
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+                outcomes = list(pool.map(one_request, range(args.requests)))
+            wall = time.perf_counter() - started
+        finally:
+            server.shutdown()
+
+    latencies = [latency for latency, _ in outcomes]
+    statuses = Counter(str(status) for _, status in outcomes)
+
+    return {
+        'config': {
+            'requests': args.requests,
+            'concurrency': args.concurrency,
+            'distinct_names': args.distinct or args.requests,
+            'cache': args.cache,
+            'search_latency_ms': args.search_latency,
+            'page_latency_ms': args.page_latency,
+            'page_size_bytes': args.page_size,
+            'error_rate': args.error_rate,
+            'site_hosts': args.site_hosts,
+            'seed': args.seed,
+            'cpu_offload': backend.CPU_OFFLOAD,
+        },
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+        },
+        'started_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'wall_seconds': round(wall, 3),
+        'throughput_rps': round(len(outcomes) / wall, 3) if wall else None,
+        'latency': summarize(latencies),
+        'stages': {stage: summarize(samples) for stage, samples in sorted(timer.samples.items())},
+        'status_codes': dict(statuses),
+        'upstream_requests': dict(config.counts),
+    }
+
+
+def print_report(result):
+    latency = result['latency']
+    print(f"Requests: {latency['count']}  wall: {result['wall_seconds']}s  "
+          f"throughput: {result['throughput_rps']} req/s")
+    print(f"Latency   p50 {latency['p50_ms']}ms  p95 {latency['p95_ms']}ms  "
+          f"p99 {latency['p99_ms']}ms  max {latency['max_ms']}ms")
+    for stage, stats in result['stages'].items():
+        print(f"  {stage:<9} calls {stats['count']:>5}  mean {stats['mean_ms']:>9}ms  "
+              f"p95 {stats['p95_ms']:>9}ms")
+    print(f"Status codes: {result['status_codes']}  upstream: {result['upstream_requests']}")
+
+
+def compare(before_path, after_path):
+    """Print the change in the headline numbers between two result files"""
+    with open(before_path) as f:
+        before = json.load(f)
+    with open(after_path) as f:
+        after = json.load(f)
+
+    def row(label, old, new):
+        if old is None or new is None:
+            return
+        change = f"{(new - old) / old * 100:+.1f}%" if old else 'n/a'
+        print(f"{label:<22} {old:>12} {new:>12} {change:>9}")
+
+    print(f"{'metric':<22} {'before':>12} {'after':>12} {'change':>9}")
+    row('throughput_rps', before['throughput_rps'], after['throughput_rps'])
+    for key in ('p50_ms', 'p95_ms', 'p99_ms', 'max_ms'):
+        row(f'latency {key}', before['latency'].get(key), after['latency'].get(key))
+    for stage in sorted(set(before['stages']) | set(after['stages'])):
+        old = before['stages'].get(stage, {}).get('mean_ms')
+        new = after['stages'].get(stage, {}).get('mean_ms')
+        row(f'{stage} mean_ms', old, new)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline load test for the hackathon analyzer')
+    parser.add_argument('--requests', type=int, default=100)
+    parser.add_argument('--concurrency', type=int, default=10)
+    parser.add_argument('--name', default='Benchmark Hackathon', help='base hackathon name')
+    parser.add_argument('--distinct', type=int, default=0,
+                        help='cycle through this many names (0 = every request unique)')
+    parser.add_argument('--cache', action='store_true', help='keep the result cache and hackathon index enabled')
+    parser.add_argument('--search-latency', type=float, default=50, help='stand-in search latency (ms)')
+    parser.add_argument('--page-latency', type=float, default=100, help='stand-in page latency (ms)')
+    parser.add_argument('--page-size', type=int, default=50000, help='hackathon page size (bytes)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of upstream 503s')
+    parser.add_argument('--site-hosts', type=int, default=8, help='separate stand-in site servers')
+    parser.add_argument('--slow-page-rate', type=float, default=0.0, help='fraction of pages served slowly')
+    parser.add_argument('--slow-page-latency', type=float, default=2000, help='latency of a slow page (ms)')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', help='write results to this JSON file')
+    parser.add_argument('--compare', nargs=2, metavar=('BEFORE', 'AFTER'),
+                        help='compare two result files instead of running')
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    result = run(args)
+    print_report(result)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(result, f, indent=2)
+        print(f"Saved results to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
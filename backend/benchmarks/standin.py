@@ -0,0 +1,259 @@
+"""
+Local stand-in for DuckDuckGo and hackathon sites
+
+Serves, from local HTTP servers:
+- /html/?q=...        DuckDuckGo-style results (div.result__body blocks)
+- /hackathon/<slug>   Hackathon landing pages of a configurable size
+
+Search runs on its own port and pages are spread over several "site" ports,
+so the backend's per-host connection limits behave like they do against
+the real, separate upstream hosts.
+
+Latency, page size and error rate are configurable so the backend can be
+benchmarked without touching the real internet. Point the backend at it with
+HACKATHON_SEARCH_URL=http://127.0.0.1:<port>/html/
+
+Usage (standalone):
+    python benchmarks/standin.py --port 8765 --page-size 200000 --page-latency 300
+"""
+
+import argparse
+import html
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+PARAGRAPHS = [
+    'Join students and developers for a weekend of building with machine learning and cloud tools.',
+    'Teams of up to four build projects with React, Python, Docker and GitHub.',
+    'Prizes for the best blockchain, healthcare and education hacks.',
+    'Registration is open now - submission deadline announced soon.',
+    'Mentors from our sponsors run workshops on AWS, Firebase and MongoDB.',
+]
+
+
+class StandinConfig:
+    """
+    Behaviour of the stand-in server
+
+    Args:
+        search_latency (float): Seconds before a search response is sent
+        page_latency (float): Seconds before a hackathon page is sent
+        page_size (int): Approximate bytes of HTML per hackathon page
+        error_rate (float): Fraction of requests answered with a 503
+        results_per_query (int): Search results returned per query
+        site_hosts (int): Number of separate site servers pages are spread over
+        jitter (float): Random extra latency, as a fraction of the base latency
+        seed (int): Random seed for reproducible error/jitter patterns
+        slow_page_rate (float): Fraction of pages served with slow_page_latency
+        slow_page_latency (float): Seconds before a slow page is sent (tail latency)
+    """
+
+    def __init__(self, search_latency=0.05, page_latency=0.1, page_size=50000,
+                 error_rate=0.0, results_per_query=3, site_hosts=8, jitter=0.2, seed=1,
+                 slow_page_rate=0.0, slow_page_latency=2.0):
+        self.search_latency = search_latency
+        self.page_latency = page_latency
+        self.page_size = page_size
+        self.error_rate = error_rate
+        self.results_per_query = results_per_query
+        self.site_hosts = site_hosts
+        self.jitter = jitter
+        self.slow_page_rate = slow_page_rate
+        self.slow_page_latency = slow_page_latency
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.counts = {'search': 0, 'page': 0, 'errors': 0}
+
+    def delay(self, base):
+        with self.lock:
+            extra = self.rng.uniform(0, base * self.jitter)
+        time.sleep(base + extra)
+
+    def page_delay(self):
+        with self.lock:
+            slow = self.rng.random() < self.slow_page_rate
+        self.delay(self.slow_page_latency if slow else self.page_latency)
+
+    def should_fail(self):
+        with self.lock:
+            return self.rng.random() < self.error_rate
+
+
+def slugify(text):
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-') or 'hackathon'
+
+
+def build_page(slug, size):
+    """Hackathon landing page padded to roughly `size` bytes"""
+    head = (
+        f'<html><head><title>{slug} hackathon</title>'
+        '<style>body { font-family: sans-serif; }</style>'
+        '<script>window.analytics = {"enabled": true};</script></head><body>'
+        '<nav><a href="/">Home</a><a href="/faq">FAQ</a></nav>'
+        f'<h1>{slug}</h1>'
+    )
+    tail = '<footer>Copyright hackathon organizers</footer></body></html>'
+    parts = [head]
+    length = len(head) + len(tail)
+    index = 0
+    while length < size:
+        paragraph = f'<p>{PARAGRAPHS[index % len(PARAGRAPHS)]}</p>'
+        parts.append(paragraph)
+        length += len(paragraph)
+        index += 1
+    parts.append(tail)
+    return ''.join(parts).encode('utf-8')
+
+
+def build_results(query, site_urls, count):
+    """DuckDuckGo HTML results markup for a query, linking to the site servers"""
+    slug = slugify(query.replace('official hackathon', ''))
+    offset = sum(slug.encode('utf-8'))
+    blocks = []
+    for rank in range(count):
+        site_url = site_urls[(offset + rank) % len(site_urls)]
+        link = f'{site_url}/hackathon/{slug}-{rank}'
+        blocks.append(
+            '<div class="result results_links"><div class="result__body">'
+            f'<h2><a class="result__a" href="{link}">{html.escape(query)} result {rank}</a></h2>'
+            f'<a class="result__snippet" href="{link}">{html.escape(PARAGRAPHS[rank % len(PARAGRAPHS)])}</a>'
+            '</div></div>'
+        )
+    return ('<html><body><div class="results">' + ''.join(blocks) + '</div></body></html>').encode('utf-8')
+
+
+def make_handler(config, site_urls):
+    class StandinHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, format, *args):
+            pass
+
+        def handle(self):
+            try:
+                super().handle()
+            except ConnectionResetError:
+                # Client dropped a kept-alive connection (e.g. streamed page closed early)
+                pass
+
+        def send_body(self, status, body, content_type='text/html; charset=utf-8'):
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            try:
+                self.wfile.write(body)
+            except (BrokenPipeError, ConnectionResetError):
+                # Streaming extraction closes the socket once it has enough text
+                pass
+
+        def do_GET(self):
+            parsed = urlparse(self.path)
+
+            if parsed.path.startswith('/html'):
+                with config.lock:
+                    config.counts['search'] += 1
+                config.delay(config.search_latency)
+                if config.should_fail():
+                    with config.lock:
+                        config.counts['errors'] += 1
+                    return self.send_body(503, b'')
+                query = parse_qs(parsed.query).get('q', ['hackathon'])[0]
+                return self.send_body(200, build_results(query, site_urls, config.results_per_query))
+
+            if parsed.path.startswith('/hackathon/'):
+                with config.lock:
+                    config.counts['page'] += 1
+                config.page_delay()
+                if config.should_fail():
+                    with config.lock:
+                        config.counts['errors'] += 1
+                    return self.send_body(503, b'')
+                slug = parsed.path.rsplit('/', 1)[-1]
+                return self.send_body(200, build_page(slug, config.page_size))
+
+            self.send_body(404, b'not found', 'text/plain')
+
+    return StandinHandler
+
+
+class StandinServer:
+    """Run the search and site stand-ins on background threads (context manager)"""
+
+    def __init__(self, config=None, host='127.0.0.1', port=0):
+        self.config = config or StandinConfig()
+        self.site_urls = []
+        self.servers = []
+
+        handler = make_handler(self.config, self.site_urls)
+        self.search_httpd = ThreadingHTTPServer((host, port), handler)
+        self.servers.append(self.search_httpd)
+        for _ in range(max(1, self.config.site_hosts)):
+            site = ThreadingHTTPServer((host, 0), handler)
+            self.servers.append(site)
+            self.site_urls.append(self._url(site))
+
+        for server in self.servers:
+            server.daemon_threads = True
+
+    @staticmethod
+    def _url(server):
+        host, port = server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    @property
+    def base_url(self):
+        return self._url(self.search_httpd)
+
+    @property
+    def search_url(self):
+        return f'{self.base_url}/html/'
+
+    def __enter__(self):
+        for server in self.servers:
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        for server in self.servers:
+            server.shutdown()
+            server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local DuckDuckGo/hackathon site stand-in')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--search-latency', type=float, default=50, help='ms')
+    parser.add_argument('--page-latency', type=float, default=100, help='ms')
+    parser.add_argument('--page-size', type=int, default=50000, help='bytes')
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--site-hosts', type=int, default=8)
+    parser.add_argument('--slow-page-rate', type=float, default=0.0)
+    parser.add_argument('--slow-page-latency', type=float, default=2000, help='ms')
+    args = parser.parse_args()
+
+    config = StandinConfig(
+        search_latency=args.search_latency / 1000,
+        page_latency=args.page_latency / 1000,
+        page_size=args.page_size,
+        error_rate=args.error_rate,
+        site_hosts=args.site_hosts,
+        slow_page_rate=args.slow_page_rate,
+        slow_page_latency=args.slow_page_latency / 1000,
+    )
+    with StandinServer(config, port=args.port) as server:
+        print(f"Stand-in running at {server.base_url}")
+        print(f"Use HACKATHON_SEARCH_URL={server.search_url}")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
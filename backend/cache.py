@@ -0,0 +1,323 @@
+"""
+Tiered result cache for hackathon analyses
+
+Two tiers sit in front of the search -> scrape -> analyze pipeline:
+1. In-process LRU (OrderedDict) with a maximum number of entries
+2. Optional SQLite file on disk so results survive a restart
+
+Every entry carries its own TTL. Once the TTL has passed the entry is
+"stale": it is still served, but one background refresh is started so the
+next caller gets fresh data. Entries older than the stale window are dropped.
+
+Uses only the Python standard library (FREE!).
+"""
+
+import contextvars
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from observability import get_logger
+
+logger = get_logger('cache')
+
+
+class AnalysisCache:
+    """
+    Two-tier (memory + optional SQLite) cache with stale-while-revalidate
+
+    Args:
+        max_entries (int): Maximum entries kept in the memory tier
+        ttl (float): Default seconds an entry stays fresh
+        stale_ttl (float): Extra seconds a stale entry may still be served
+        db_path (str): SQLite file for the disk tier, or None for memory only
+        disk_max_entries (int): Maximum rows kept in the disk tier
+        cacheable (callable): Decides whether a loaded value may be stored
+    """
+
+    def __init__(self, max_entries=256, ttl=3600, stale_ttl=86400,
+                 db_path=None, disk_max_entries=5000, cacheable=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.db_path = db_path
+        self.disk_max_entries = disk_max_entries
+        self.cacheable = cacheable or (lambda value: value is not None)
+
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._db = None
+
+        self._stats = {
+            'hits': 0,
+            'stale_hits': 0,
+            'misses': 0,
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'evictions': 0,
+            'disk_evictions': 0,
+            'expired': 0,
+            'refreshes': 0,
+            'refresh_errors': 0,
+        }
+
+        if db_path:
+            self._open_db()
+
+    # ------------------------------------------------------------------
+    # Disk tier
+    # ------------------------------------------------------------------
+
+    def _open_db(self):
+        """Open (or create) the SQLite disk tier"""
+        self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS analysis_cache ('
+            ' key TEXT PRIMARY KEY,'
+            ' value TEXT NOT NULL,'
+            ' expires_at REAL NOT NULL,'
+            ' stale_until REAL NOT NULL,'
+            ' accessed_at REAL NOT NULL)'
+        )
+        self._db.commit()
+
+    def close(self):
+        """Close the disk tier connection (e.g. before forking workers)"""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def reopen(self):
+        """Open a fresh disk tier connection (e.g. in a forked worker)"""
+        with self._lock:
+            if self.db_path and self._db is None:
+                self._open_db()
+
+    def _disk_get(self, key):
+        row = self._db.execute(
+            'SELECT value, expires_at, stale_until FROM analysis_cache WHERE key = ?',
+            (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        self._db.execute(
+            'UPDATE analysis_cache SET accessed_at = ? WHERE key = ?',
+            (time.time(), key)
+        )
+        self._db.commit()
+        return {'value': json.loads(row[0]), 'expires_at': row[1], 'stale_until': row[2]}
+
+    def _disk_set(self, key, entry):
+        self._db.execute(
+            'INSERT OR REPLACE INTO analysis_cache'
+            ' (key, value, expires_at, stale_until, accessed_at) VALUES (?, ?, ?, ?, ?)',
+            (key, json.dumps(entry['value']), entry['expires_at'], entry['stale_until'], time.time())
+        )
+
+        # Drop rows that are past their stale window, then trim to the size limit
+        self._db.execute('DELETE FROM analysis_cache WHERE stale_until < ?', (time.time(),))
+        count = self._db.execute('SELECT COUNT(*) FROM analysis_cache').fetchone()[0]
+        overflow = count - self.disk_max_entries
+        if overflow > 0:
+            self._db.execute(
+                'DELETE FROM analysis_cache WHERE key IN ('
+                ' SELECT key FROM analysis_cache ORDER BY accessed_at ASC LIMIT ?)',
+                (overflow,)
+            )
+            self._stats['disk_evictions'] += overflow
+        self._db.commit()
+
+    def _disk_delete(self, key):
+        self._db.execute('DELETE FROM analysis_cache WHERE key = ?', (key,))
+        self._db.commit()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def _memory_put(self, key, entry):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._stats['evictions'] += 1
+
+    def lookup(self, key):
+        """
+        Look up a key in memory first, then on disk
+
+        Returns:
+            tuple: (value, state) where state is 'fresh', 'stale' or None on miss
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                source = 'memory_hits'
+            elif self._db is not None:
+                entry = self._disk_get(key)
+                source = 'disk_hits'
+                if entry is not None:
+                    self._memory_put(key, entry)
+
+            if entry is None:
+                self._stats['misses'] += 1
+                return None, None
+
+            if now >= entry['stale_until']:
+                # Too old to serve at all
+                self._memory.pop(key, None)
+                if self._db is not None:
+                    self._disk_delete(key)
+                self._stats['expired'] += 1
+                self._stats['misses'] += 1
+                return None, None
+
+            self._stats[source] += 1
+            if now < entry['expires_at']:
+                self._stats['hits'] += 1
+                return entry['value'], 'fresh'
+
+            self._stats['stale_hits'] += 1
+            return entry['value'], 'stale'
+
+    def set(self, key, value, ttl=None):
+        """
+        Store a value in both tiers
+
+        Args:
+            key (str): Cache key (normalized hackathon name)
+            value: JSON-serializable value
+            ttl (float): Seconds the entry stays fresh (defaults to self.ttl)
+        """
+        ttl = self.ttl if ttl is None else ttl
+        now = time.time()
+        entry = {
+            'value': value,
+            'expires_at': now + ttl,
+            'stale_until': now + ttl + self.stale_ttl,
+        }
+        with self._lock:
+            self._memory_put(key, entry)
+            if self._db is not None:
+                self._disk_set(key, entry)
+
+    def get_or_load(self, key, loader, ttl=None, refresh_loader=None):
+        """
+        Return a cached value, loading it on a miss
+
+        Stale entries are returned immediately while a single background
+        thread reloads them (stale-while-revalidate).
+
+        Args:
+            key (str): Cache key
+            loader (callable): Zero-argument function producing the value
+            ttl (float): Per-entry TTL override
+            refresh_loader (callable): Used instead of loader for the
+                                       background reload, which outlives this
+                                       call (so it must not report to the caller)
+
+        Returns:
+            tuple: (value, state) where state is 'fresh', 'stale' or 'miss'
+        """
+        value, state = self.lookup(key)
+        if state == 'fresh':
+            return value, state
+
+        if state == 'stale':
+            self._refresh_in_background(key, refresh_loader or loader, ttl)
+            return value, state
+
+        value = loader()
+        if self.cacheable(value):
+            self.set(key, value, ttl)
+        return value, 'miss'
+
+    def _refresh_in_background(self, key, loader, ttl):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                value = loader()
+                if self.cacheable(value):
+                    self.set(key, value, ttl)
+                with self._lock:
+                    self._stats['refreshes'] += 1
+            except Exception as e:
+                logger.warning("Cache refresh error", extra={'cache_key': key, 'error': str(e)})
+                with self._lock:
+                    self._stats['refresh_errors'] += 1
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        # Carry the request id of the caller that found the stale entry
+        threading.Thread(target=contextvars.copy_context().run, args=(refresh,), daemon=True).start()
+
+    def refresh(self, key, loader, ttl=None):
+        """
+        Load a value now and store it if cacheable (used for prewarming)
+
+        Returns:
+            The loaded value
+        """
+        value = loader()
+        if self.cacheable(value):
+            self.set(key, value, ttl)
+        return value
+
+    def expires_in(self, key):
+        """
+        Seconds until an entry goes stale (negative once it is), None if absent
+
+        Only peeks - hit/miss counters and LRU order are left alone.
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at = entry['expires_at']
+            elif self._db is not None:
+                row = self._db.execute(
+                    'SELECT expires_at FROM analysis_cache WHERE key = ?', (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                expires_at = row[0]
+            else:
+                return None
+        return expires_at - time.time()
+
+    def invalidate(self, key):
+        """Remove a key from both tiers"""
+        with self._lock:
+            self._memory.pop(key, None)
+            if self._db is not None:
+                self._disk_delete(key)
+
+    def stats(self):
+        """Return hit/miss/eviction counters and tier sizes"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['memory_entries'] = len(self._memory)
+            stats['memory_max_entries'] = self.max_entries
+            stats['refreshing'] = len(self._refreshing)
+            if self._db is not None:
+                stats['disk_entries'] = self._db.execute(
+                    'SELECT COUNT(*) FROM analysis_cache'
+                ).fetchone()[0]
+            else:
+                stats['disk_entries'] = None
+
+        lookups = stats['hits'] + stats['stale_hits'] + stats['misses']
+        stats['hit_ratio'] = round((stats['hits'] + stats['stale_hits']) / lookups, 4) if lookups else 0.0
+        return stats
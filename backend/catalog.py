@@ -0,0 +1,327 @@
+"""
+Catalog of known hackathons with indexed fuzzy name resolution
+
+Each entry has a display name, aliases and the official URL. Names are
+resolved without any upstream traffic:
+1. Exact: every name and alias is stored in a compact form (lowercase,
+   accents and punctuation removed, filler words and years dropped, no
+   spaces), so "Tree Hacks 2026!" and "TreeHacks" are the same dict key
+2. Fuzzy (opt-in): a character trigram index proposes the forms sharing the
+   most trigrams with the query; a banded edit-distance check confirms them
+   ("treehaks" -> TreeHacks). Many real hackathons are a typo apart
+   ("HackNY", "HackNYU", "HackNC"), so a fuzzy match is only a hint - for
+   use after a search failed, never in place of one
+3. Partial (opt-in): a run of the query's words that is a known name
+   ("ETHGlobal Paris" -> ETHGlobal)
+
+Years in the query are kept as the edition, so an exact match gets a
+stable cache key: "Tree Hacks 2026" -> "treehacks 2026".
+
+Catalog files are a JSON list of entries, or JSON Lines (one per line):
+    {"name": "TreeHacks", "aliases": ["Tree Hacks"], "url": "https://www.treehacks.com",
+     "description": "Stanford's annual hackathon"}
+"""
+
+import json
+import re
+import threading
+import unicodedata
+from collections import Counter
+
+# Words that do not tell one hackathon from another
+FILLER_WORDS = frozenset({'hackathon', 'hackathons', 'official', 'the', 'annual', 'edition'})
+EDITION_PATTERN = re.compile(r'^(?:19|20)\d\d$')
+# Words many names share; they do not count towards the length a fuzzy match
+# is judged by, also when joined to another word, so neither "A Hacks" nor
+# "HackNC" is one typo away from "LA Hacks" or "HackNY"
+COMMON_WORDS = frozenset({'hack', 'hacks', 'jam', 'fest', 'con', 'challenge', 'summit', 'cup', 'week', 'day'})
+
+# Fuzzy lookups count shared trigrams starting from the query's rarest
+# trigram and stop after GRAM_BUDGET postings (common trigrams like "ack"
+# would otherwise dominate); at most MAX_CANDIDATES forms are then verified
+GRAM_BUDGET = 4000
+MAX_CANDIDATES = 8
+MAX_EDIT_DISTANCE = 3
+
+
+def normalize_name(name):
+    """
+    Stable normalized form of a name (lowercase, no accents or punctuation)
+    e.g. "  Hack Zürich   2025! " -> "hack zurich 2025"
+    """
+    name = unicodedata.normalize('NFKD', name)
+    name = ''.join(ch for ch in name if not unicodedata.combining(ch))
+    name = re.sub(r'[^\w\s]', ' ', name.lower())
+    return ' '.join(name.split())
+
+
+def split_name(name):
+    """
+    Split a name into the words that identify the hackathon and its edition
+
+    Returns:
+        tuple: (name words, edition words) - "Tree Hacks 2026" ->
+               (['tree', 'hacks'], ['2026'])
+    """
+    tokens = normalize_name(name).split()
+    words = [token for token in tokens if not EDITION_PATTERN.match(token)]
+    edition = [token for token in tokens if EDITION_PATTERN.match(token)]
+    meaningful = [word for word in words if word not in FILLER_WORDS]
+    return meaningful or words, edition
+
+
+def distinctive_length(words):
+    """
+    Characters of the name words outside COMMON_WORDS, with common words
+    also stripped from the start or end of a word ("hacknyu" -> "nyu")
+    """
+    total = 0
+    for word in words:
+        if word in COMMON_WORDS:
+            continue
+        prefix = max((len(common) for common in COMMON_WORDS if word.startswith(common)), default=0)
+        suffix = max((len(common) for common in COMMON_WORDS
+                      if word.endswith(common) and len(common) <= len(word) - prefix), default=0)
+        total += len(word) - prefix - suffix
+    return total
+
+
+def trigrams(form):
+    """Character trigrams of a compact form, padded so short forms have some"""
+    padded = f'^{form}$'
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def bounded_edit_distance(a, b, limit):
+    """
+    Edit distance (Levenshtein plus adjacent transpositions, so "treehakcs"
+    is one edit from "treehacks"), computed only within `limit` of the diagonal
+
+    Returns:
+        int: The distance, or limit + 1 when it is larger than limit
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    if len(a) > len(b):
+        a, b = b, a
+    too_far = limit + 1
+    before_previous = None
+    previous = [j if j <= limit else too_far for j in range(len(b) + 1)]
+    for i, char in enumerate(a, 1):
+        current = [too_far] * (len(b) + 1)
+        if i <= limit:
+            current[0] = i
+        low, high = max(1, i - limit), min(len(b), i + limit)
+        best = current[0]
+        for j in range(low, high + 1):
+            cost = previous[j - 1] + (char != b[j - 1])
+            if previous[j] + 1 < cost:
+                cost = previous[j] + 1
+            if current[j - 1] + 1 < cost:
+                cost = current[j - 1] + 1
+            if (before_previous is not None and j > 1 and char == b[j - 2] and a[i - 2] == b[j - 1]
+                    and before_previous[j - 2] + 1 < cost):
+                cost = before_previous[j - 2] + 1
+            current[j] = cost
+            if cost < best:
+                best = cost
+        if best > limit:
+            return too_far
+        before_previous, previous = previous, current
+    return min(previous[-1], too_far)
+
+
+class HackathonCatalog:
+    """
+    In-memory catalog of known hackathons, indexed for name resolution
+
+    Args:
+        entries (list): Dicts with 'name', optional 'aliases', 'url',
+                        'description' and 'key' (defaults to the normalized name)
+        min_score (float): Lowest fuzzy score accepted: 1 - distance / length,
+                           the length leaving out COMMON_WORDS (see
+                           distinctive_length)
+    """
+
+    def __init__(self, entries, min_score=0.75):
+        self.min_score = min_score
+        self.entries = []
+        self._exact = {}      # compact form -> entry index
+        self._forms = []      # form id -> (compact form, entry index, edit limit)
+        self._postings = {}   # (trigram, form length) -> [form id, ...]
+        self._lock = threading.Lock()
+        self._stats = {'lookups': 0, 'exact': 0, 'fuzzy': 0, 'partial': 0, 'misses': 0}
+
+        for entry in entries:
+            self._add(entry)
+
+    @classmethod
+    def load(cls, path, **kwargs):
+        """Build a catalog from a JSON (list) or JSON Lines file"""
+        with open(path, encoding='utf-8') as f:
+            if path.endswith('.jsonl'):
+                entries = [json.loads(line) for line in f if line.strip()]
+            else:
+                entries = json.load(f)
+        return cls(entries, **kwargs)
+
+    def _add(self, entry):
+        index = len(self.entries)
+        entry = {
+            'key': entry.get('key') or normalize_name(entry['name']),
+            'name': entry['name'],
+            'aliases': list(entry.get('aliases', ())),
+            'url': entry.get('url', ''),
+            'description': entry.get('description', ''),
+        }
+        self.entries.append(entry)
+
+        for name in [entry['name'], *entry['aliases']]:
+            words = split_name(name)[0]
+            form = ''.join(words)
+            if not form or form in self._exact:
+                continue  # First entry claiming a form keeps it
+            self._exact[form] = index
+            form_id = len(self._forms)
+            self._forms.append((form, index, self._edit_limit(distinctive_length(words))))
+            for gram in trigrams(form):
+                self._postings.setdefault((gram, len(form)), []).append(form_id)
+
+    def _edit_limit(self, distinctive):
+        """Edits allowed for a name with this many distinctive characters"""
+        return min(MAX_EDIT_DISTANCE, int(distinctive * (1 - self.min_score)))
+
+    def _fuzzy(self, form, distinctive):
+        """
+        Closest indexed form within the allowed edit distance
+
+        The limit follows from the shorter of the two names, so a short alias
+        ("TPA") is not a typo's distance from a longer query ("tpat").
+
+        Args:
+            form (str): Compact query form
+            distinctive (int): Characters of the query outside COMMON_WORDS
+
+        Returns:
+            tuple or None: (entry index, score); None also when two entries
+                           are equally close
+        """
+        limit = self._edit_limit(distinctive)
+        if limit == 0:
+            return None
+
+        # Only forms within `limit` characters of the query's length can match
+        lengths = range(len(form) - limit, len(form) + limit + 1)
+        gram_postings = []
+        for gram in trigrams(form):
+            postings = [self._postings[key] for key in ((gram, length) for length in lengths)
+                        if key in self._postings]
+            gram_postings.append((sum(map(len, postings)), postings))
+        gram_postings.sort(key=lambda item: item[0])
+
+        shared = Counter()
+        counted = used = 0
+        for size, postings in gram_postings:
+            if counted + size > GRAM_BUDGET and used:
+                break
+            for posting in postings:
+                shared.update(posting)
+            counted += size
+            used += 1
+
+        # An edit changes at most 3 trigrams (a transposition 4), so a form
+        # within `limit` edits shares at least used - 4 * limit of those counted
+        needed = used - 4 * limit
+        best, best_indexes = limit + 1, set()
+        for form_id, count in shared.most_common(MAX_CANDIDATES):
+            if count < needed:
+                break
+            candidate, index, candidate_limit = self._forms[form_id]
+            allowed = min(limit, candidate_limit)
+            distance = bounded_edit_distance(form, candidate, min(allowed, best))
+            if distance > allowed:
+                continue
+            if distance < best:
+                best, best_indexes = distance, {index}
+            elif distance == best:
+                best_indexes.add(index)
+        if len(best_indexes) != 1:
+            return None
+        return best_indexes.pop(), round(1 - best / distinctive, 4)
+
+    def _partial(self, words):
+        """Longest run of the query's words that is a known name: entry index or None"""
+        for size in range(len(words) - 1, 0, -1):
+            for start in range(len(words) - size + 1):
+                index = self._exact.get(''.join(words[start:start + size]))
+                if index is not None:
+                    return index
+        return None
+
+    def _count(self, outcome):
+        with self._lock:
+            self._stats['lookups'] += 1
+            self._stats[outcome] += 1
+
+    def resolve(self, name, allow_fuzzy=False, allow_partial=False):
+        """
+        Resolve a free-form name to a catalog entry
+
+        Only exact matches (name or alias, any spacing, case, punctuation or
+        year) identify the hackathon; the other kinds are hints for when the
+        search found nothing.
+
+        Args:
+            name (str): Hackathon name as typed, e.g. "tree hacks 2026"
+            allow_fuzzy (bool): Also accept the closest name within a few
+                                typos ("treehaks" -> TreeHacks)
+            allow_partial (bool): Also accept a known name inside a longer
+                                  one ("ETHGlobal Paris" -> ETHGlobal)
+
+        Returns:
+            dict or None: {'entry', 'match' ('exact', 'fuzzy' or 'partial'),
+                           'score', 'key'}; key is the canonical cache key
+                           (entry key plus edition) for exact matches and
+                           the normalized name otherwise
+        """
+        words, edition = split_name(name)
+        form = ''.join(words)
+        if not form:
+            self._count('misses')
+            return None
+
+        index, match, score = self._exact.get(form), 'exact', 1.0
+        if index is None and allow_fuzzy:
+            found = self._fuzzy(form, distinctive_length(words))
+            if found is not None:
+                (index, score), match = found, 'fuzzy'
+        if index is None and allow_partial:
+            index, match, score = self._partial(words), 'partial', 0.5
+        if index is None:
+            self._count('misses')
+            return None
+
+        self._count(match)
+        entry = self.entries[index]
+        if match == 'exact':
+            key = ' '.join([entry['key'], *edition])
+        else:
+            # Possibly another hackathon ("HackNC" -> HackNY, "ETHGlobal Paris"
+            # -> ETHGlobal) - only the URL is borrowed, never the cache entry
+            key = normalize_name(name)
+        return {'entry': entry, 'match': match, 'score': score, 'key': key}
+
+    @staticmethod
+    def search_results(resolution):
+        """A resolution in the shape of search results ({'title', 'link', 'snippet'})"""
+        entry = resolution['entry']
+        return [{'title': entry['name'], 'link': entry['url'], 'snippet': entry['description']}]
+
+    def __len__(self):
+        return len(self.entries)
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+        stats.update(entries=len(self.entries), forms=len(self._forms), posting_lists=len(self._postings))
+        return stats
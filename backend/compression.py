@@ -0,0 +1,125 @@
+"""
+Negotiated gzip / brotli response compression
+
+Analysis payloads are mostly long template strings that repeat across
+responses, so they compress very well. Compressor picks the best encoding
+the client accepts, skips bodies below a size threshold, streams (SSE) and
+responses that are already encoded, and keeps the compressed bytes of
+ETag-tagged responses so a popular analysis is compressed only once.
+
+brotli is optional: without the `brotli` package only gzip is offered.
+"""
+
+import gzip
+import threading
+from collections import OrderedDict
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_TYPES = ('application/json', 'text/')
+
+
+class Compressor:
+    """
+    Compress Flask/Werkzeug responses according to Accept-Encoding
+
+    Args:
+        min_size (int): Bodies smaller than this many bytes are sent as is
+        gzip_level (int): gzip compression level (1-9)
+        brotli_quality (int): brotli quality (0-11)
+        cache_size (int): Compressed bodies kept per (ETag, encoding)
+    """
+
+    def __init__(self, min_size=1024, gzip_level=6, brotli_quality=5, cache_size=256):
+        self.min_size = min_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            'compressed': 0,
+            'cache_hits': 0,
+            'skipped_small': 0,
+            'bytes_in': 0,
+            'bytes_out': 0,
+        }
+
+    @property
+    def encodings(self):
+        """Supported encodings, most preferred first"""
+        return ['br', 'gzip'] if brotli is not None else ['gzip']
+
+    def _compress(self, body, encoding):
+        if encoding == 'br':
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level)
+
+    def compress_response(self, response, accept_encodings):
+        """
+        Compress a response in place when that is worthwhile
+
+        Args:
+            response (flask.Response): Response about to be sent
+            accept_encodings (werkzeug Accept): request.accept_encodings
+
+        Returns:
+            flask.Response: The same response object
+        """
+        if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+                or 'Content-Encoding' in response.headers
+                or not (response.mimetype or '').startswith(COMPRESSIBLE_TYPES)):
+            return response
+
+        # The body depends on Accept-Encoding from here on, compressed or not
+        response.vary.add('Accept-Encoding')
+        encoding = accept_encodings.best_match(self.encodings)
+        if encoding is None:
+            return response
+
+        body = response.get_data()
+        if len(body) < self.min_size:
+            with self._lock:
+                self._stats['skipped_small'] += 1
+            return response
+
+        etag, _ = response.get_etag()
+        key = (etag, encoding) if etag else None
+        compressed = None
+        if key is not None:
+            with self._lock:
+                compressed = self._cache.get(key)
+                if compressed is not None:
+                    self._cache.move_to_end(key)
+                    self._stats['cache_hits'] += 1
+
+        if compressed is None:
+            compressed = self._compress(body, encoding)
+            if key is not None and self.cache_size > 0:
+                with self._lock:
+                    self._cache[key] = compressed
+                    while len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
+
+        with self._lock:
+            self._stats['compressed'] += 1
+            self._stats['bytes_in'] += len(body)
+            self._stats['bytes_out'] += len(compressed)
+
+        response.set_data(compressed)
+        response.headers['Content-Encoding'] = encoding
+        if etag:
+            # Same content, different bytes: the tag stays comparable but weak
+            response.set_etag(etag, weak=True)
+        return response
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats['cached_bodies'] = len(self._cache)
+        stats['encodings'] = self.encodings
+        stats['ratio'] = round(stats['bytes_out'] / stats['bytes_in'], 4) if stats['bytes_in'] else None
+        return stats
@@ -0,0 +1,74 @@
+"""
+Pre-serialized JSON fragments
+
+Most of an analysis response is template text that depends only on the
+detected domain and technologies, so the same sections are re-encoded for
+every request. FragmentCache keeps the encoded bytes of each section keyed
+by the inputs that determine it; responses are then assembled by joining
+cached fragments.
+
+Uses only the Python standard library (FREE!).
+"""
+
+import json
+import threading
+from collections import OrderedDict
+
+_encoder = json.JSONEncoder(separators=(',', ':'))
+
+
+def encode_json(value):
+    """Compact JSON encoding as UTF-8 bytes"""
+    return _encoder.encode(value).encode('utf-8')
+
+
+class FragmentCache:
+    """
+    Bounded LRU of encoded JSON fragments
+
+    Args:
+        max_entries (int): Maximum fragments kept (0 disables caching)
+    """
+
+    def __init__(self, max_entries=2048):
+        self.max_entries = max_entries
+        self._fragments = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    def encode(self, section, key, value):
+        """
+        Encoded JSON for a response section, from the cache when possible
+
+        Args:
+            section (str): Response field name (e.g. 'tips')
+            key: Hashable value that fully determines `value`
+            value: Section value, encoded on a miss
+
+        Returns:
+            bytes: JSON encoding of value
+        """
+        cache_key = (section, key)
+        with self._lock:
+            fragment = self._fragments.get(cache_key)
+            if fragment is not None:
+                self._fragments.move_to_end(cache_key)
+                self._stats['hits'] += 1
+                return fragment
+            self._stats['misses'] += 1
+
+        fragment = encode_json(value)
+        if self.max_entries > 0:
+            with self._lock:
+                self._fragments[cache_key] = fragment
+                while len(self._fragments) > self.max_entries:
+                    self._fragments.popitem(last=False)
+                    self._stats['evictions'] += 1
+        return fragment
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._fragments)
+            stats['max_entries'] = self.max_entries
+        return stats
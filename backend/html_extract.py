@@ -0,0 +1,179 @@
+"""
+Streaming, bounded-memory visible-text extraction
+
+Instead of downloading a whole page and building a BeautifulSoup tree,
+the body is fed chunk by chunk into an incremental HTML tokenizer
+(html.parser from the standard library). Unwanted subtrees are skipped as
+they stream past, and reading stops as soon as enough visible text has been
+collected or a hard byte cap is reached. Memory and parse time therefore stay
+flat no matter how large the page is.
+
+When parsing is offloaded to a process pool, read_body() collects the
+(capped) raw bytes on the I/O thread and extract_text_from_bytes() parses
+them in the worker.
+"""
+
+import codecs
+from html.parser import HTMLParser
+
+# Same elements the BeautifulSoup path removes with decompose()
+SKIP_TAGS = {'script', 'style', 'nav', 'footer'}
+
+DEFAULT_MAX_CHARS = 5000
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024
+DEFAULT_CHUNK_SIZE = 16 * 1024
+
+
+class VisibleTextParser(HTMLParser):
+    """
+    Incremental tokenizer that collects visible text outside SKIP_TAGS
+
+    Args:
+        max_chars (int): Stop collecting once this many characters are seen
+    """
+
+    def __init__(self, max_chars=DEFAULT_MAX_CHARS):
+        super().__init__(convert_charrefs=True)
+        self.max_chars = max_chars
+        self.parts = []
+        self.length = 0
+        self._skip_depth = 0
+
+    @property
+    def done(self):
+        # Collect one character past the limit so we know whether to add "..."
+        return self.length > self.max_chars
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIP_TAGS:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in SKIP_TAGS and self._skip_depth > 0:
+            self._skip_depth -= 1
+
+    def handle_startendtag(self, tag, attrs):
+        # <nav/> opens and closes nothing
+        pass
+
+    def handle_data(self, data):
+        if self._skip_depth or self.done:
+            return
+        text = data.strip()
+        if text:
+            # Join with single spaces like get_text(separator=' ', strip=True)
+            if self.parts:
+                self.length += 1
+            self.parts.append(text)
+            self.length += len(text)
+
+    def text(self):
+        text = ' '.join(self.parts)
+        if len(text) > self.max_chars:
+            text = text[:self.max_chars] + "..."
+        return text
+
+
+def _response_charset(response):
+    """Charset from the Content-Type header, defaulting to UTF-8"""
+    content_type = response.headers.get('Content-Type', '')
+    for param in content_type.split(';')[1:]:
+        key, _, value = param.strip().partition('=')
+        if key.lower() == 'charset' and value:
+            charset = value.strip('"\'')
+            try:
+                codecs.lookup(charset)
+                return charset
+            except LookupError:
+                break
+    return 'utf-8'
+
+
+def extract_visible_text(response, max_chars=DEFAULT_MAX_CHARS,
+                         max_bytes=DEFAULT_MAX_BYTES, chunk_size=DEFAULT_CHUNK_SIZE, deadline=None):
+    """
+    Stream a response body into VisibleTextParser
+
+    Args:
+        response (requests.Response): Response opened with stream=True
+        max_chars (int): Visible characters to keep (same cut as the old path)
+        max_bytes (int): Hard cap on bytes read from the socket
+        chunk_size (int): Bytes per read
+        deadline (Deadline): Stop reading (keeping the text so far) once it expires
+
+    Returns:
+        str: Visible text, truncated to max_chars with a trailing "..."
+    """
+    parser = VisibleTextParser(max_chars=max_chars)
+    decoder = codecs.getincrementaldecoder(_response_charset(response))(errors='replace')
+
+    bytes_read = 0
+    try:
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            if not chunk:
+                continue
+            chunk = chunk[:max_bytes - bytes_read]
+            bytes_read += len(chunk)
+            parser.feed(decoder.decode(chunk))
+            if parser.done or bytes_read >= max_bytes:
+                break
+            if deadline is not None and deadline.expired:
+                break
+        else:
+            parser.feed(decoder.decode(b'', final=True))
+        parser.close()
+    finally:
+        # Stop reading the socket as soon as we have enough
+        response.close()
+
+    return parser.text()
+
+
+def read_body(response, max_bytes=DEFAULT_MAX_BYTES, chunk_size=DEFAULT_CHUNK_SIZE, deadline=None):
+    """
+    Read a streaming response body up to max_bytes (or until the deadline)
+
+    Returns:
+        tuple: (body bytes, charset) for extract_text_from_bytes()
+    """
+    chunks = []
+    bytes_read = 0
+    try:
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            if not chunk:
+                continue
+            chunk = chunk[:max_bytes - bytes_read]
+            chunks.append(chunk)
+            bytes_read += len(chunk)
+            if bytes_read >= max_bytes:
+                break
+            if deadline is not None and deadline.expired:
+                break
+    finally:
+        response.close()
+    return b''.join(chunks), _response_charset(response)
+
+
+def extract_text_from_bytes(body, charset='utf-8', max_chars=DEFAULT_MAX_CHARS):
+    """
+    Visible text of an already downloaded body (same output as extract_visible_text)
+
+    Args:
+        body (bytes): Raw HTML
+        charset (str): Encoding from the response headers
+        max_chars (int): Visible characters to keep
+
+    Returns:
+        str: Visible text, truncated to max_chars with a trailing "..."
+    """
+    parser = VisibleTextParser(max_chars=max_chars)
+    decoder = codecs.getincrementaldecoder(charset)(errors='replace')
+    # Fed in chunks so parsing stops soon after enough text is collected
+    for start in range(0, len(body), DEFAULT_CHUNK_SIZE):
+        parser.feed(decoder.decode(body[start:start + DEFAULT_CHUNK_SIZE]))
+        if parser.done:
+            break
+    else:
+        parser.feed(decoder.decode(b'', final=True))
+    parser.close()
+    return parser.text()
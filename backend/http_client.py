@@ -0,0 +1,329 @@
+"""
+Shared pooled HTTP client for search and scraping
+
+One requests.Session is reused for every upstream call, so TCP/TLS
+connections are kept alive and pooled per host instead of being opened
+for each request. On top of that the client adds:
+1. Bounded retries with jittered exponential backoff (timeouts, 5xx)
+2. Conditional GETs - ETag / Last-Modified validators are remembered so
+   unchanged pages come back as a cheap 304
+3. A cap on concurrent requests per upstream host
+4. An optional Deadline (resilience.py) that caps every attempt, backoff
+   and wait for a host slot, so retries never outlast the caller's budget
+5. Optional per-host rate limiting for background traffic: a limiter set
+   in throttle_var (e.g. by the prewarmer) is applied to every attempt
+   made in that context
+"""
+
+import contextvars
+import random
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from metrics import Counter, Gauge, Histogram
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+RETRY_STATUS_CODES = {500, 502, 503, 504}
+
+# Metric label shared by every host not named in metric_hosts, so scraping
+# arbitrary sites cannot grow the label sets without bound
+OTHER_HOSTS_LABEL = 'page'
+
+# Rate limiter (anything with acquire(host, timeout) -> bool) for requests
+# made in the current context; None means unthrottled
+throttle_var = contextvars.ContextVar('upstream_throttle', default=None)
+
+UPSTREAM_DURATION = Histogram(
+    'hackathon_upstream_request_duration_seconds',
+    'Time per upstream HTTP attempt (headers received)',
+    ['host'],
+)
+UPSTREAM_ERRORS = Counter(
+    'hackathon_upstream_errors_total',
+    'Failed upstream HTTP attempts by host and reason',
+    ['host', 'reason'],
+)
+UPSTREAM_IN_FLIGHT = Gauge(
+    'hackathon_upstream_in_flight',
+    'Upstream HTTP requests currently in flight',
+    ['host'],
+)
+
+
+class DeadlineExceeded(requests.RequestException):
+    """
+    The caller's deadline ran out on our side: waiting for the rate limiter
+    or a host slot, no time left to send, or an attempt whose timeout the
+    deadline had to shorten
+
+    Not a requests.Timeout: the upstream was never given its full timeout,
+    so callers should not count this against it.
+    """
+
+
+class HttpClient:
+    """
+    Keep-alive HTTP client with retries and ETag/Last-Modified revalidation
+
+    Args:
+        pool_connections (int): Number of per-host connection pools to keep
+        pool_maxsize (int): Max connections kept alive per host
+        max_retries (int): Extra attempts after a timeout/connection error/5xx
+        backoff_base (float): Base seconds for exponential backoff
+        backoff_max (float): Upper bound for a single backoff sleep
+        max_per_host (int): Max concurrent requests per upstream host
+        validator_cache_size (int): Max URLs whose validators/bodies are kept
+        metric_hosts (iterable): Hosts that keep their own label in the
+                                 upstream metrics; all others are 'page'
+    """
+
+    def __init__(self, pool_connections=20, pool_maxsize=20, max_retries=2,
+                 backoff_base=0.3, backoff_max=4.0, max_per_host=4,
+                 validator_cache_size=512, metric_hosts=()):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_per_host = max_per_host
+        self.validator_cache_size = validator_cache_size
+        self.metric_hosts = frozenset(host.lower() for host in metric_hosts)
+
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self._validated = OrderedDict()  # (url, kind) -> validators + stored payload
+        self._host_semaphores = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            'requests': 0,
+            'retries': 0,
+            'not_modified': 0,
+            'errors': 0,
+            'deadline_exceeded': 0,
+        }
+
+    def _acquire_slot(self, host, timeout=None):
+        """
+        Take one of the host's slots (caps concurrent requests per host)
+
+        Returns:
+            threading.BoundedSemaphore: To be released by the caller
+
+        Raises:
+            DeadlineExceeded: No slot became free within timeout seconds
+        """
+        with self._lock:
+            semaphore = self._host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.max_per_host)
+                self._host_semaphores[host] = semaphore
+        if not semaphore.acquire(timeout=timeout):
+            raise self._deadline_exceeded(host, f'No free connection slot for {host}')
+        return semaphore
+
+    def _backoff(self, attempt, deadline=None):
+        """Full-jitter exponential backoff (never sleeping past the deadline)"""
+        limit = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        if deadline is not None:
+            limit = min(limit, deadline.remaining())
+        time.sleep(random.uniform(0, limit))
+
+    def _metric_host(self, host):
+        return host if host in self.metric_hosts else OTHER_HOSTS_LABEL
+
+    def _deadline_exceeded(self, host, message='Deadline exceeded before the request could be sent'):
+        UPSTREAM_ERRORS.inc(host=self._metric_host(host), reason='deadline')
+        with self._lock:
+            self._stats['deadline_exceeded'] += 1
+        return DeadlineExceeded(message)
+
+    def _conditional_headers(self, key):
+        with self._lock:
+            cached = self._validated.get(key)
+        if cached is None:
+            return None, {}
+
+        headers = {}
+        if cached['etag']:
+            headers['If-None-Match'] = cached['etag']
+        if cached['last_modified']:
+            headers['If-Modified-Since'] = cached['last_modified']
+        return cached['payload'], headers
+
+    def _remember(self, key, response, payload):
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not (etag or last_modified):
+            return
+        with self._lock:
+            self._validated[key] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'payload': payload,
+            }
+            self._validated.move_to_end(key)
+            while len(self._validated) > self.validator_cache_size:
+                self._validated.popitem(last=False)
+
+    def _request(self, url, headers, timeout, stream=False, deadline=None, consume=None):
+        """
+        Send a GET with bounded, jittered retries on timeouts and 5xx
+
+        With consume, the final response is passed to consume(response) while
+        the host slot is still held, and its result is returned - so a
+        streamed body counts against the per-host cap until it is read.
+
+        When the deadline runs out - between attempts, or during an attempt
+        whose timeout it had to shorten - the last upstream error is raised,
+        or DeadlineExceeded when there is none.
+        """
+        host = urlparse(url).netloc.lower()
+        label = self._metric_host(host)
+        attempt = 0
+        last_error = None
+        while True:
+            throttle = throttle_var.get()
+            if throttle is not None:
+                wait_limit = deadline.remaining() if deadline is not None else None
+                if not throttle.acquire(host, timeout=wait_limit):
+                    raise last_error or self._deadline_exceeded(host)
+
+            attempt_timeout = timeout
+            if deadline is not None:
+                attempt_timeout = min(timeout, deadline.remaining())
+                if attempt_timeout <= 0:
+                    raise last_error or self._deadline_exceeded(host)
+
+            try:
+                slot = self._acquire_slot(host, timeout=attempt_timeout if deadline is not None else None)
+            except DeadlineExceeded:
+                if last_error is not None:
+                    raise last_error from None
+                raise
+            try:
+                if deadline is not None:
+                    # The slot wait came out of the same budget
+                    attempt_timeout = min(timeout, deadline.remaining())
+                    if attempt_timeout <= 0:
+                        raise last_error or self._deadline_exceeded(host)
+                with self._lock:
+                    self._stats['requests'] += 1
+                try:
+                    with UPSTREAM_IN_FLIGHT.track_in_progress(host=label), UPSTREAM_DURATION.time(host=label):
+                        response = self.session.get(url, headers=headers, timeout=attempt_timeout, stream=stream)
+                except (requests.Timeout, requests.ConnectionError) as e:
+                    if isinstance(e, requests.Timeout) and attempt_timeout < timeout and deadline.expired:
+                        # Cut short by the caller's budget, not the upstream's own timeout
+                        raise last_error or self._deadline_exceeded(host, str(e)) from e
+                    UPSTREAM_ERRORS.inc(host=label, reason='timeout' if isinstance(e, requests.Timeout) else 'connection')
+                    if attempt >= self.max_retries or (deadline is not None and deadline.expired):
+                        with self._lock:
+                            self._stats['errors'] += 1
+                        raise
+                    last_error = e
+                else:
+                    if response.status_code >= 400:
+                        UPSTREAM_ERRORS.inc(host=label, reason=f'http_{response.status_code}')
+                    if (response.status_code not in RETRY_STATUS_CODES or attempt >= self.max_retries
+                            or (deadline is not None and deadline.expired)):
+                        return consume(response) if consume is not None else response
+                    response.close()
+                    last_error = requests.HTTPError(f'{response.status_code} from {host}', response=response)
+            finally:
+                slot.release()
+
+            with self._lock:
+                self._stats['retries'] += 1
+            self._backoff(attempt, deadline)
+            attempt += 1
+
+    def get(self, url, timeout=10, revalidate=True, deadline=None):
+        """
+        GET a URL through the shared session
+
+        Args:
+            url (str): URL to fetch
+            timeout (float): Per-attempt timeout in seconds
+            revalidate (bool): Send If-None-Match / If-Modified-Since when
+                               a previous response had validators
+            deadline (Deadline): Overall budget for all attempts and backoff
+
+        Returns:
+            requests.Response: The response. A 304 is answered with the
+                               previously stored 200 response.
+
+        Raises:
+            requests.RequestException: When every attempt failed
+        """
+        key = (url, 'response')
+        cached, headers = self._conditional_headers(key) if revalidate else (None, {})
+
+        response = self._request(url, headers, timeout, deadline=deadline)
+        if response.status_code == 304 and cached is not None:
+            with self._lock:
+                self._stats['not_modified'] += 1
+            return cached
+
+        if response.status_code == 200:
+            self._remember(key, response, response)
+        return response
+
+    def get_extracted(self, url, extract, timeout=10, revalidate=True, deadline=None):
+        """
+        Stream a URL into an extractor and return only the extracted value
+
+        The body is never fully buffered - extract() reads it from the open
+        streaming response, holding the host slot until it is done. The
+        extracted value (not the body) is kept for
+        revalidation, so a 304 returns it without any parsing.
+
+        Args:
+            url (str): URL to fetch
+            extract (callable): Takes a streaming requests.Response, returns a value
+            timeout (float): Per-attempt timeout in seconds
+            revalidate (bool): Send conditional headers when validators are known
+            deadline (Deadline): Overall budget for all attempts and backoff
+
+        Returns:
+            The extracted value, or None for a non-200 response
+
+        Raises:
+            requests.RequestException: When every attempt failed
+        """
+        key = (url, 'extracted')
+        cached, headers = self._conditional_headers(key) if revalidate else (None, {})
+
+        def consume(response):
+            try:
+                if response.status_code == 304 and cached is not None:
+                    with self._lock:
+                        self._stats['not_modified'] += 1
+                    return cached
+                if response.status_code != 200:
+                    return None
+                value = extract(response)
+                # An extraction cut short by the deadline must not answer later 304s
+                if deadline is None or not deadline.expired:
+                    self._remember(key, response, value)
+                return value
+            finally:
+                response.close()
+
+        return self._request(url, headers, timeout, stream=True, deadline=deadline, consume=consume)
+
+    def stats(self):
+        """Return request/retry/304 counters"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['validated_urls'] = len(self._validated)
+        return stats
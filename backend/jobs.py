@@ -0,0 +1,238 @@
+"""
+Background analysis jobs with progress events
+
+A job runs the analysis pipeline on a background executor so the request
+thread that created it returns immediately. Each pipeline stage appends an
+event (with partial results such as search hits) to the job; clients can
+poll the job or follow the events as a Server-Sent Events stream.
+"""
+
+import contextvars
+import json
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from observability import get_logger
+
+logger = get_logger('jobs')
+
+
+class QueueFull(RuntimeError):
+    """Too many jobs are queued or running to accept another"""
+
+
+class Job:
+    """
+    One background analysis and its ordered progress events
+
+    Args:
+        hackathon_name (str): Name being analyzed
+    """
+
+    def __init__(self, hackathon_name):
+        self.id = uuid.uuid4().hex
+        self.hackathon_name = hackathon_name
+        self.status = 'queued'
+        self.created_at = time.time()
+        self.finished_at = None
+        self.result = None
+        self.error = None
+        self.events = []
+        self._condition = threading.Condition()
+
+    @property
+    def done(self):
+        return self.status in ('completed', 'failed')
+
+    def emit(self, stage, data=None):
+        """Record a progress event and wake up any waiting streams"""
+        with self._condition:
+            self.events.append({
+                'id': len(self.events) + 1,
+                'stage': stage,
+                'data': data or {},
+                'at': time.time(),
+            })
+            self._condition.notify_all()
+
+    def set_status(self, status):
+        with self._condition:
+            self.status = status
+            self._condition.notify_all()
+
+    def finish(self, result=None, error=None):
+        """Mark the job completed (or failed) and publish the final event"""
+        with self._condition:
+            self.result = result
+            self.error = error
+            self.status = 'failed' if error else 'completed'
+            self.finished_at = time.time()
+            self.events.append({
+                'id': len(self.events) + 1,
+                'stage': self.status,
+                'data': {'error': error} if error else result,
+                'at': self.finished_at,
+            })
+            self._condition.notify_all()
+
+    def wait_for_events(self, after_id, timeout):
+        """
+        Block until there are events newer than after_id, or timeout
+
+        Returns:
+            tuple: (new events list, done flag)
+        """
+        with self._condition:
+            if len(self.events) <= after_id and not self.done:
+                self._condition.wait(timeout)
+            return self.events[after_id:], self.done
+
+    def wait(self, timeout=None):
+        """Block until the job is done; returns the done flag"""
+        with self._condition:
+            return self._condition.wait_for(lambda: self.done, timeout)
+
+    def to_dict(self):
+        with self._condition:
+            return {
+                'job_id': self.id,
+                'hackathon_name': self.hackathon_name,
+                'status': self.status,
+                'created_at': self.created_at,
+                'finished_at': self.finished_at,
+                'stages': [event['stage'] for event in self.events],
+                'partial': {event['stage']: event['data'] for event in self.events
+                            if event['stage'] not in ('completed', 'failed')},
+                'result': self.result,
+                'error': self.error,
+            }
+
+
+class JobManager:
+    """
+    Runs jobs on a bounded executor and keeps finished jobs for a while
+
+    Args:
+        max_workers (int): Concurrent background analyses
+        ttl (float): Seconds a finished job stays queryable
+        max_jobs (int): Upper bound on jobs kept in memory
+        max_pending (int): Upper bound on jobs queued or running
+    """
+
+    def __init__(self, max_workers=8, ttl=600, max_jobs=1000, max_pending=32):
+        self.ttl = ttl
+        self.max_jobs = max_jobs
+        self.max_pending = max_pending
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='job')
+        self._jobs = {}
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    def _prune(self):
+        now = time.time()
+        expired = [job_id for job_id, job in self._jobs.items()
+                   if job.done and now - job.finished_at > self.ttl]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+        # Still too many: drop the oldest finished jobs first
+        if len(self._jobs) >= self.max_jobs:
+            finished = sorted((job for job in self._jobs.values() if job.done),
+                              key=lambda job: job.finished_at)
+            for job in finished[:len(self._jobs) - self.max_jobs + 1]:
+                del self._jobs[job.id]
+
+    def submit(self, hackathon_name, run):
+        """
+        Create a job and start it in the background
+
+        Args:
+            hackathon_name (str): Name being analyzed
+            run (callable): run(job) -> result dict with 'success' and either
+                            'data' or 'error'; may call job.emit() per stage
+
+        Returns:
+            Job: The queued job
+
+        Raises:
+            QueueFull: max_pending jobs are already queued or running
+        """
+        job = Job(hackathon_name)
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise QueueFull(f'{self._pending} jobs already queued or running')
+            self._pending += 1
+            self._prune()
+            self._jobs[job.id] = job
+
+        def execute():
+            job.set_status('running')
+            try:
+                result = run(job)
+                if result['success']:
+                    job.finish(result=result['data'])
+                else:
+                    job.finish(error=result['error'])
+            except Exception as e:
+                logger.exception("Job failed", extra={'job_id': job.id})
+                job.finish(error=str(e))
+            finally:
+                with self._lock:
+                    self._pending -= 1
+
+        # Keep the submitting request's id on the job's log lines
+        self.executor.submit(contextvars.copy_context().run, execute)
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def drain(self, timeout=30):
+        """
+        Wait for queued and running jobs to finish (graceful shutdown)
+
+        Args:
+            timeout (float): Seconds to wait for all of them
+
+        Returns:
+            int: Jobs still unfinished when the timeout ran out
+        """
+        with self._lock:
+            pending = [job for job in self._jobs.values() if not job.done]
+
+        deadline = time.monotonic() + timeout
+        for job in pending:
+            job.wait(max(0.0, deadline - time.monotonic()))
+        self.executor.shutdown(wait=False)
+        return sum(1 for job in pending if not job.done)
+
+
+def sse_events(job, last_event_id=0, keepalive=15):
+    """
+    Generate a Server-Sent Events stream for a job
+
+    Args:
+        job (Job): Job to follow
+        last_event_id (int): Resume after this event id (Last-Event-ID)
+        keepalive (float): Seconds between keep-alive comments
+
+    Yields:
+        str: SSE-formatted messages, ending after the final event
+    """
+    sent = last_event_id
+    while True:
+        events, done = job.wait_for_events(sent, keepalive)
+        if not events and not done:
+            yield ': keep-alive\n\n'
+            continue
+
+        for event in events:
+            payload = json.dumps({'stage': event['stage'], 'data': event['data']})
+            yield f"id: {event['id']}\nevent: {event['stage']}\ndata: {payload}\n\n"
+            sent = event['id']
+
+        if done:
+            return
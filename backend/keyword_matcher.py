@@ -0,0 +1,116 @@
+"""
+Precompiled single-pass keyword matching
+
+All keywords of a table are compiled once into one word-boundary regex
+whose alternation is shaped like a trie (shared prefixes are factored out),
+so the regex engine walks it like an automaton instead of retrying every
+keyword at every position. A single scan over the text then returns hit counts for every
+keyword, so categories can be ranked by score. Because matches must start and
+end on word boundaries, short keywords such as 'ai' or 'tf' no longer fire
+inside words like 'maintain' or 'platform'.
+"""
+
+import re
+from collections import Counter
+
+
+def trie_pattern(keywords):
+    """
+    Build a regex alternation from a prefix trie of the keywords
+    e.g. ['react', 'reactjs', 'ruby'] -> r(?:eact(?:js)?|uby)
+
+    Spaces in multi-word keywords match any run of whitespace. Backtracking
+    into shorter alternatives keeps the longest keyword at a position winning
+    when the word boundary after it holds.
+    """
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def build(node):
+        branches = [
+            (r'\s+' if char == ' ' else re.escape(char)) + build(child)
+            for char, child in sorted(node.items())
+            if char != ''
+        ]
+        if not branches:
+            return ''
+        if len(branches) == 1 and '' not in node:
+            return branches[0]
+        group = '(?:' + '|'.join(branches) + ')'
+        # A keyword ends here, so the longer continuations are optional
+        return group + '?' if '' in node else group
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """
+    Match many keywords against a text in one pass
+
+    Args:
+        keyword_table (dict): category -> list of lowercase keywords
+    """
+
+    def __init__(self, keyword_table):
+        self.categories = list(keyword_table)
+        self.keyword_categories = {}
+        for category, keywords in keyword_table.items():
+            for keyword in keywords:
+                self.keyword_categories.setdefault(keyword, []).append(category)
+
+        # The first-character lookahead lets most positions fail before the
+        # trie is entered; the optional trailing 's' keeps plurals
+        # ('containers', 'nfts') counting
+        first_chars = ''.join(sorted({re.escape(keyword[0]) for keyword in self.keyword_categories}))
+        self.pattern = re.compile(
+            r'\b(?=[' + first_chars + r'])(' + trie_pattern(self.keyword_categories) + r')s?\b'
+        )
+
+    def _keyword_for(self, match_text):
+        if match_text in self.keyword_categories:
+            return match_text
+        # Collapse whitespace in multi-word matches back to the table form
+        keyword = ' '.join(match_text.split())
+        return keyword if keyword in self.keyword_categories else None
+
+    def keyword_counts(self, text):
+        """
+        Count keyword hits in one pass
+
+        Args:
+            text (str): Lowercased text to scan
+
+        Returns:
+            Counter: keyword -> number of hits
+        """
+        counts = Counter()
+        # findall + Counter keep the per-hit work in C
+        for match_text, count in Counter(self.pattern.findall(text)).items():
+            keyword = self._keyword_for(match_text)
+            if keyword is not None:
+                counts[keyword] += count
+        return counts
+
+    def scores(self, text):
+        """
+        Score every category by its keyword hits
+
+        Returns:
+            list: (category, score) pairs with score > 0, best first. Ties keep
+                  the table order.
+        """
+        keyword_counts = self.keyword_counts(text)
+        category_scores = Counter()
+        for keyword, count in keyword_counts.items():
+            for category in self.keyword_categories[keyword]:
+                category_scores[category] += count
+
+        order = {category: index for index, category in enumerate(self.categories)}
+        return sorted(
+            category_scores.items(),
+            key=lambda item: (-item[1], order[item[0]])
+        )
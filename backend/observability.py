@@ -0,0 +1,133 @@
+"""
+Request ids, timing spans and structured logging
+
+- request_id_var / timings_var are context variables, so every log line and
+  span knows which request it belongs to. Work handed to a thread pool keeps
+  them when it is submitted through copy_context().run.
+- span(stage) times a pipeline stage, feeds the Prometheus histograms in
+  metrics.py and collects the durations for the Server-Timing header.
+- Logs are one JSON object per line with the request id attached.
+"""
+
+import contextvars
+import json
+import logging
+import time
+from contextlib import contextmanager
+
+from metrics import Counter, Gauge, Histogram
+
+request_id_var = contextvars.ContextVar('request_id', default=None)
+timings_var = contextvars.ContextVar('timings', default=None)
+
+STAGE_DURATION = Histogram(
+    'hackathon_stage_duration_seconds',
+    'Time spent in each analysis pipeline stage',
+    ['stage'],
+)
+STAGE_ERRORS = Counter(
+    'hackathon_stage_errors_total',
+    'Exceptions raised inside a pipeline stage',
+    ['stage'],
+)
+STAGE_IN_FLIGHT = Gauge(
+    'hackathon_stage_in_flight',
+    'Pipeline stages currently running',
+    ['stage'],
+)
+
+# Attributes every LogRecord has - anything else came in through extra={...}
+_RESERVED_LOG_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, request id, message, extras"""
+
+    def format(self, record):
+        entry = {
+            'ts': self.formatTime(record, '%Y-%m-%dT%H:%M:%S') + f'.{int(record.msecs):03d}',
+            'level': record.levelname,
+            'logger': record.name,
+            'request_id': request_id_var.get(),
+            'message': record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RESERVED_LOG_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def configure_logging(level='INFO'):
+    """Send the 'hackathon' loggers to stderr as JSON lines"""
+    logger = logging.getLogger('hackathon')
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(JsonFormatter())
+        logger.addHandler(handler)
+        logger.propagate = False
+    logger.setLevel(level)
+    return logger
+
+
+def get_logger(name):
+    return logging.getLogger(f'hackathon.{name}')
+
+
+def start_request(request_id):
+    """Bind a request id and a fresh timings list to the current context"""
+    request_id_var.set(request_id)
+    timings_var.set([])
+
+
+@contextmanager
+def span(stage):
+    """
+    Time a pipeline stage
+
+    Records the duration in hackathon_stage_duration_seconds, counts
+    exceptions in hackathon_stage_errors_total (and re-raises them) and adds
+    the duration to the current request's Server-Timing entries.
+    """
+    started = time.perf_counter()
+    STAGE_IN_FLIGHT.inc(stage=stage)
+    try:
+        yield
+    except Exception:
+        STAGE_ERRORS.inc(stage=stage)
+        raise
+    finally:
+        elapsed = time.perf_counter() - started
+        STAGE_IN_FLIGHT.dec(stage=stage)
+        STAGE_DURATION.observe(elapsed, stage=stage)
+        timings = timings_var.get()
+        if timings is not None:
+            timings.append((stage, elapsed))
+
+
+def server_timing_header(total=None, extra=()):
+    """
+    Build a Server-Timing header from the spans recorded in this context
+
+    Repeated stages (e.g. from a batch) are summed and their count put in desc.
+
+    Args:
+        total (float): Seconds for the whole request, added as "total"
+        extra (iterable): Additional preformatted entries (e.g. 'cache;desc="HIT"')
+    """
+    totals = {}
+    counts = {}
+    for stage, elapsed in timings_var.get() or []:
+        totals[stage] = totals.get(stage, 0.0) + elapsed
+        counts[stage] = counts.get(stage, 0) + 1
+
+    entries = list(extra)
+    for stage, elapsed in totals.items():
+        entry = f'{stage};dur={elapsed * 1000:.1f}'
+        if counts[stage] > 1:
+            entry += f';desc="{counts[stage]} calls"'
+        entries.append(entry)
+    if total is not None:
+        entries.append(f'total;dur={total * 1000:.1f}')
+    return ', '.join(entries)
@@ -0,0 +1,206 @@
+"""
+Process-pool offload of CPU-bound work (HTML parsing, analysis)
+
+Parsing a page and running the keyword analysis are pure Python and hold the
+GIL, so on a threaded server one large page stalls every other request.
+CpuPool runs such functions in worker processes instead, while network I/O
+stays on the request threads:
+1. Only plain data crosses the process boundary - raw bytes in, compact text
+   or result dicts out - and functions are pickled by reference
+2. Backpressure: at most max_pending tasks are queued or running; callers
+   wait up to queue_wait seconds for a slot, then get PoolSaturated
+3. Per-task time limit: a task that overruns gets TaskTimeout. Its worker
+   can only be stopped by killing it, so the pool is replaced; tasks that
+   were killed along with it are retried once on the new pool
+"""
+
+import importlib
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+from metrics import Counter, Gauge
+from observability import get_logger
+
+logger = get_logger('offload')
+
+OFFLOAD_TASKS = Counter(
+    'hackathon_offload_tasks_total',
+    'CPU-bound tasks sent to the process pool by outcome',
+    ['outcome'],
+)
+OFFLOAD_PENDING = Gauge(
+    'hackathon_offload_pending',
+    'Tasks queued or running in the process pool',
+)
+
+
+class OffloadError(RuntimeError):
+    """A task could not be run in the process pool"""
+
+
+class PoolSaturated(OffloadError):
+    """No pool slot became free within the queue wait"""
+
+
+class TaskTimeout(OffloadError):
+    """A task overran its time limit and was killed"""
+
+
+def _preload(modules):
+    """Worker initializer: import modules up front instead of on the first task"""
+    for module in modules:
+        importlib.import_module(module)
+
+
+def _ping():
+    return True
+
+
+def default_start_method():
+    """forkserver where available: workers never inherit the server's threads and locks"""
+    methods = multiprocessing.get_all_start_methods()
+    return 'forkserver' if 'forkserver' in methods else 'spawn'
+
+
+class CpuPool:
+    """
+    Bounded process pool for CPU-bound functions
+
+    Args:
+        workers (int): Worker processes
+        max_pending (int): Tasks queued or running at once (backpressure)
+        task_timeout (float): Seconds a task may take from submission
+        queue_wait (float): Seconds a caller waits for a free slot
+        start_method (str): multiprocessing start method (default_start_method())
+        preload (tuple): Modules every worker imports when it starts
+    """
+
+    def __init__(self, workers, max_pending, task_timeout=2.0, queue_wait=0.5,
+                 start_method=None, preload=()):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.task_timeout = task_timeout
+        self.queue_wait = queue_wait
+        self.start_method = start_method or default_start_method()
+        self.preload = tuple(preload)
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._stats = {
+            'completed': 0,
+            'failed': 0,
+            'saturated': 0,
+            'timed_out': 0,
+            'retried': 0,
+            'recycled': 0,
+        }
+
+    def _get_executor(self):
+        # Created lazily, so a preloading parent (gunicorn) forks no pool
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context(self.start_method),
+                    initializer=_preload,
+                    initargs=(self.preload,),
+                )
+            return self._executor
+
+    def _recycle(self, executor):
+        """Kill the workers of a pool with a runaway (or crashed) task and start afresh"""
+        with self._lock:
+            if self._executor is not executor:
+                return  # Another caller already replaced it
+            self._executor = None
+            self._stats['recycled'] += 1
+        # ProcessPoolExecutor has no public way to stop a running task
+        processes = list((executor._processes or {}).values())
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            process.terminate()
+        logger.warning("Process pool recycled", extra={'workers': len(processes)})
+
+    def _count(self, outcome):
+        with self._lock:
+            self._stats[outcome] += 1
+        OFFLOAD_TASKS.inc(outcome=outcome)
+
+    def run(self, fn, *args, timeout=None, deadline=None):
+        """
+        Run fn(*args) in a worker process and return its result
+
+        Args:
+            fn (callable): Module-level function (pickled by reference)
+            timeout (float): Override for task_timeout
+            deadline (Deadline): Caps the wait for a free slot
+
+        Returns:
+            Whatever fn returned
+
+        Raises:
+            PoolSaturated: No slot became free in time
+            TaskTimeout: The task overran its time limit
+            Exception: Whatever fn raised
+        """
+        wait = self.queue_wait if deadline is None else min(self.queue_wait, deadline.remaining())
+        if not self._slots.acquire(timeout=wait):
+            self._count('saturated')
+            raise PoolSaturated(f"CPU pool saturated ({self.max_pending} tasks pending)")
+
+        limit = self.task_timeout if timeout is None else timeout
+        with self._lock:
+            self._pending += 1
+        OFFLOAD_PENDING.inc()
+        try:
+            for attempt in range(2):
+                executor = self._get_executor()
+                try:
+                    result = executor.submit(fn, *args).result(timeout=limit)
+                except FuturesTimeoutError:
+                    self._count('timed_out')
+                    self._recycle(executor)
+                    raise TaskTimeout(f"{fn.__name__} exceeded {limit:.1f}s") from None
+                except BrokenProcessPool:
+                    # Killed along with another task's runaway worker, or a worker crashed
+                    self._recycle(executor)
+                    if attempt:
+                        self._count('failed')
+                        raise
+                    self._count('retried')
+                    continue
+                except Exception:
+                    self._count('failed')
+                    raise
+                self._count('completed')
+                return result
+        finally:
+            with self._lock:
+                self._pending -= 1
+            OFFLOAD_PENDING.dec()
+            self._slots.release()
+
+    def warm(self):
+        """Start the worker processes now rather than on the first task"""
+        executor = self._get_executor()
+        for _ in range(self.workers):
+            executor.submit(_ping)
+
+    def shutdown(self, wait=True):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats['pending'] = self._pending
+            stats['running'] = self._executor is not None
+        stats.update(workers=self.workers, max_pending=self.max_pending,
+                     task_timeout=self.task_timeout, start_method=self.start_method)
+        return stats
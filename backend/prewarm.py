@@ -0,0 +1,235 @@
+"""
+Background prewarming of popular hackathon analyses
+
+Cold lookups pay the full search -> scrape -> analyze cost. The Prewarmer
+keeps the analyses of well-known names (a configured seed list) and of the
+most requested names warm in the result cache:
+1. PopularityTracker counts lookups with exponential decay, so the set of
+   popular names follows current demand
+2. Every interval, names whose cached entry is missing or about to expire
+   are re-analyzed on a background thread, off the request path
+3. RateLimiter (token bucket per upstream host) keeps the refresh traffic
+   polite; it only applies to the prewarmer's own requests
+"""
+
+import threading
+import time
+
+from observability import get_logger
+
+logger = get_logger('prewarm')
+
+
+class PopularityTracker:
+    """
+    Decaying lookup counts per normalized name
+
+    Args:
+        half_life (float): Seconds after which a lookup counts half as much
+        max_tracked (int): Names kept; the least popular are dropped first
+    """
+
+    def __init__(self, half_life=6 * 3600, max_tracked=1000):
+        self.half_life = half_life
+        self.max_tracked = max_tracked
+        self._scores = {}  # key -> [score, updated_at, display name]
+        self._lock = threading.Lock()
+
+    def _decayed(self, score, updated_at, now):
+        return score * 0.5 ** ((now - updated_at) / self.half_life)
+
+    def record(self, key, name):
+        now = time.time()
+        with self._lock:
+            entry = self._scores.get(key)
+            score = self._decayed(entry[0], entry[1], now) if entry else 0.0
+            self._scores[key] = [score + 1.0, now, name]
+            if len(self._scores) > self.max_tracked:
+                coldest = min(self._scores, key=lambda k: self._decayed(*self._scores[k][:2], now))
+                del self._scores[coldest]
+
+    def top(self, n, min_score=0.0):
+        """
+        Most requested names right now
+
+        Returns:
+            list: (key, display name, score) tuples, most popular first
+        """
+        now = time.time()
+        with self._lock:
+            scored = [(key, name, self._decayed(score, updated_at, now))
+                      for key, (score, updated_at, name) in self._scores.items()]
+        scored = [entry for entry in scored if entry[2] >= min_score]
+        scored.sort(key=lambda entry: entry[2], reverse=True)
+        return scored[:n]
+
+    def __len__(self):
+        with self._lock:
+            return len(self._scores)
+
+
+class RateLimiter:
+    """
+    Token bucket per upstream host
+
+    Args:
+        default_rate (float): Requests per second allowed for any host
+        burst (int): Requests that may be sent back to back
+        rates (dict): Per-host overrides {host: requests per second}
+    """
+
+    def __init__(self, default_rate, burst=1, rates=None):
+        self.default_rate = default_rate
+        self.burst = burst
+        self.rates = dict(rates or {})
+        self._buckets = {}  # host -> [tokens, updated_at]
+        self._lock = threading.Lock()
+
+    def _refill(self, host, now):
+        rate = self.rates.get(host, self.default_rate)
+        bucket = self._buckets.setdefault(host, [float(self.burst), now])
+        bucket[0] = min(float(self.burst), bucket[0] + (now - bucket[1]) * rate)
+        bucket[1] = now
+        return bucket, rate
+
+    def delay(self, host):
+        """Seconds until a request to host would be allowed (0 if now)"""
+        with self._lock:
+            bucket, rate = self._refill(host, time.monotonic())
+            return 0.0 if bucket[0] >= 1 else (1 - bucket[0]) / rate
+
+    def acquire(self, host, timeout=None):
+        """
+        Take one token for host, waiting for it if needed
+
+        Returns:
+            bool: False if no token became available within timeout
+        """
+        give_up_at = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                bucket, rate = self._refill(host, now)
+                if bucket[0] >= 1:
+                    bucket[0] -= 1
+                    return True
+                wait = (1 - bucket[0]) / rate
+            if give_up_at is not None:
+                if now + wait > give_up_at:
+                    return False
+            time.sleep(wait)
+
+
+class Prewarmer:
+    """
+    Background thread that refreshes popular analyses before they expire
+
+    Args:
+        refresh (callable): refresh(name) -> bool; re-analyzes a name and
+                            stores the result, True when it was stored
+        expires_in (callable): expires_in(key) -> seconds until the cached
+                               entry goes stale, or None when not cached
+        normalize (callable): Display name -> cache key
+        seeds (list): Names always kept warm
+        tracker (PopularityTracker): Lookup counts
+        limiter (RateLimiter): Limits for the refresh traffic
+        pace_host (str): Host whose limit paces the refreshes (the search host)
+        interval (float): Seconds between refresh cycles
+        refresh_ahead (float): Refresh entries expiring within this many seconds
+        top_n (int): Popular names considered each cycle
+        min_score (float): Decayed lookup count needed to count as popular
+        max_per_cycle (int): Refreshes started per cycle
+        initial_delay (float): Seconds before the first cycle
+    """
+
+    def __init__(self, refresh, expires_in, normalize, seeds, tracker, limiter, pace_host=None,
+                 interval=60, refresh_ahead=600, top_n=20, min_score=2.0, max_per_cycle=10,
+                 initial_delay=5):
+        self.refresh = refresh
+        self.expires_in = expires_in
+        self.normalize = normalize
+        self.seeds = list(seeds)
+        self.tracker = tracker
+        self.limiter = limiter
+        self.pace_host = pace_host
+        self.interval = interval
+        self.refresh_ahead = refresh_ahead
+        self.top_n = top_n
+        self.min_score = min_score
+        self.max_per_cycle = max_per_cycle
+        self.initial_delay = initial_delay
+
+        self._thread = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._stats = {
+            'cycles': 0,
+            'refreshed': 0,
+            'failed': 0,
+            'last_cycle_at': None,
+        }
+
+    def due(self):
+        """Names to refresh now: popular names first, then the seeds"""
+        candidates = {}
+        for key, name, _ in self.tracker.top(self.top_n, self.min_score):
+            candidates.setdefault(key, name)
+        for name in self.seeds:
+            candidates.setdefault(self.normalize(name), name)
+
+        names = []
+        for key, name in candidates.items():
+            remaining = self.expires_in(key)
+            if remaining is None or remaining < self.refresh_ahead:
+                names.append(name)
+        return names[:self.max_per_cycle]
+
+    def run_cycle(self):
+        """Refresh every due name, paced by the rate limiter"""
+        for name in self.due():
+            if self.pace_host and self._stop.wait(self.limiter.delay(self.pace_host)):
+                break
+            if self._stop.is_set():
+                break
+            try:
+                stored = self.refresh(name)
+            except Exception as e:
+                logger.warning("Prewarm error", extra={'hackathon_name': name, 'error': str(e)})
+                stored = False
+            with self._lock:
+                self._stats['refreshed' if stored else 'failed'] += 1
+
+        with self._lock:
+            self._stats['cycles'] += 1
+            self._stats['last_cycle_at'] = time.strftime('%Y-%m-%d %H:%M:%S')
+
+    def _run(self):
+        if self._stop.wait(self.initial_delay):
+            return
+        while not self._stop.is_set():
+            self.run_cycle()
+            self._stop.wait(self.interval)
+
+    def start(self):
+        """Start the background thread (once per process)"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='prewarm', daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats['running'] = self._thread is not None and self._thread.is_alive()
+        stats['tracked_names'] = len(self.tracker)
+        stats['seeds'] = len(self.seeds)
+        stats['popular'] = [name for _, name, _ in self.tracker.top(self.top_n, self.min_score)]
+        return stats
@@ -0,0 +1,221 @@
+"""
+Deadlines, adaptive timeouts and circuit breaking for upstream calls
+
+- Deadline: an overall latency budget for one pipeline run. Every stage
+  gets a child deadline carved out of it, so search + scrape together can
+  never outlast it.
+- AdaptiveTimeout: a timeout that follows the recently observed latency of
+  an upstream (a high percentile times a safety factor), within fixed bounds.
+- CircuitBreaker: after repeated failures calls are skipped for a cool-down
+  period, then a single probe is let through (half-open); its outcome closes
+  the circuit again or re-opens it.
+"""
+
+import contextvars
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from metrics import Counter, Gauge
+
+deadline_var = contextvars.ContextVar('deadline', default=None)
+
+CIRCUIT_STATE = Gauge(
+    'hackathon_circuit_state',
+    'Circuit breaker state (0 closed, 1 half-open, 2 open)',
+    ['name'],
+)
+CIRCUIT_SHORT_CIRCUITS = Counter(
+    'hackathon_circuit_short_circuits_total',
+    'Calls skipped because the circuit was open',
+    ['name'],
+)
+
+
+class Deadline:
+    """
+    Latency budget shared by the stages of one pipeline run
+
+    Args:
+        budget (float): Seconds from now until the deadline
+    """
+
+    def __init__(self, budget):
+        self.budget = budget
+        self.expires_at = time.monotonic() + budget
+
+    def remaining(self):
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self):
+        return time.monotonic() >= self.expires_at
+
+    def child(self, share=1.0, reserve=0.0):
+        """
+        Deadline for one stage, carved out of this one
+
+        Args:
+            share (float): Fraction of the remaining budget the stage may use
+            reserve (float): Seconds kept back for the stages after this one
+
+        Returns:
+            Deadline: Expires no later than this deadline
+        """
+        return Deadline(max(0.0, (self.remaining() - reserve) * share))
+
+    def cancel(self):
+        """Expire now - work checking this deadline stops at its next check"""
+        self.expires_at = min(self.expires_at, time.monotonic())
+
+
+def current_deadline():
+    """The deadline of the pipeline run in this context, or None"""
+    return deadline_var.get()
+
+
+@contextmanager
+def deadline_scope(budget):
+    """Bind a new Deadline to the current context for the duration of the block"""
+    deadline = Deadline(budget)
+    token = deadline_var.set(deadline)
+    try:
+        yield deadline
+    finally:
+        deadline_var.reset(token)
+
+
+class AdaptiveTimeout:
+    """
+    Timeout derived from recent upstream latency
+
+    Calls that time out are recorded at the timeout they were given, so a
+    slowing upstream pushes the timeout up step by step until the ceiling.
+
+    Args:
+        initial (float): Timeout used until min_samples latencies are known
+        floor (float): Lowest timeout ever returned
+        ceiling (float): Highest timeout ever returned
+        percentile (float): Latency percentile the timeout is based on
+        factor (float): Safety multiplier applied to that percentile
+        window (int): Number of recent samples kept
+        min_samples (int): Samples needed before adapting
+    """
+
+    def __init__(self, initial, floor, ceiling, percentile=0.95, factor=3.0,
+                 window=200, min_samples=20):
+        self.initial = initial
+        self.floor = floor
+        self.ceiling = ceiling
+        self.percentile = percentile
+        self.factor = factor
+        self.min_samples = min_samples
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def observe(self, seconds):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def current(self):
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return self.initial
+            ordered = sorted(self._samples)
+        latency = ordered[int(self.percentile * (len(ordered) - 1))]
+        return min(self.ceiling, max(self.floor, latency * self.factor))
+
+    def stats(self):
+        with self._lock:
+            samples = len(self._samples)
+        return {'timeout': round(self.current(), 3), 'samples': samples}
+
+
+class CircuitBreaker:
+    """
+    Closed -> open after failure_threshold consecutive failures; open ->
+    half-open after reset_timeout seconds, letting one probe through
+
+    Args:
+        name (str): Label used in metrics and logs
+        failure_threshold (int): Consecutive failures that open the circuit
+        reset_timeout (float): Seconds the circuit stays open before a probe
+    """
+
+    CLOSED = 'closed'
+    HALF_OPEN = 'half_open'
+    OPEN = 'open'
+
+    _STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+    def __init__(self, name, failure_threshold=5, reset_timeout=30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+        self._stats = {'opened': 0, 'short_circuited': 0, 'probes': 0}
+        CIRCUIT_STATE.set(0, name=name)
+
+    def _set_state(self, state):
+        self._state = state
+        CIRCUIT_STATE.set(self._STATE_VALUES[state], name=self.name)
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._state
+
+    def allow(self):
+        """
+        Whether a call may go to the upstream now
+
+        Callers that get True must report the outcome with record_success(),
+        record_failure() or, when the call never reached the upstream,
+        release().
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._set_state(self.HALF_OPEN)
+            if self._state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                self._stats['probes'] += 1
+                return True
+            self._stats['short_circuited'] += 1
+        CIRCUIT_SHORT_CIRCUITS.inc(name=self.name)
+        return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._probing = False
+            if self._state != self.CLOSED:
+                self._set_state(self.CLOSED)
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._probing = False
+            if self._state == self.HALF_OPEN or (
+                    self._state == self.CLOSED and self._failures >= self.failure_threshold):
+                self._set_state(self.OPEN)
+                self._opened_at = time.monotonic()
+                self._stats['opened'] += 1
+
+    def release(self):
+        """Call allowed but never sent: free the probe, keep the state"""
+        with self._lock:
+            self._probing = False
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats['state'] = self._state
+            stats['consecutive_failures'] = self._failures
+        return stats
@@ -0,0 +1,186 @@
+"""
+Local full-text index of analyzed hackathons (SQLite FTS5)
+
+Every successful analysis stores the scraped page text, the search results
+and snippets, and the detected domain and technologies. The index:
+1. Answers ranked full-text queries (/api/search-hackathons) in milliseconds
+   with no upstream traffic
+2. Remembers the search results of names we already know, so the pipeline
+   can skip the external search step for them
+
+Uses only the Python standard library (sqlite3 with FTS5).
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+
+from observability import get_logger
+
+logger = get_logger('index')
+
+
+def fts5_available():
+    """True when the linked SQLite library was built with FTS5"""
+    try:
+        sqlite3.connect(':memory:').execute('CREATE VIRTUAL TABLE t USING fts5(a)')
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+def build_match_query(text):
+    """
+    Turn free text into a safe FTS5 MATCH expression
+
+    Every word is quoted (so FTS5 operators in user input are inert) and
+    the last word gets a prefix wildcard: "tree hack" -> "tree" "hack"*
+    """
+    words = re.findall(r'\w+', text.lower())
+    if not words:
+        return None
+    terms = [f'"{word}"' for word in words]
+    terms[-1] += '*'
+    return ' '.join(terms)
+
+
+class HackathonIndex:
+    """
+    SQLite FTS5 index of scraped hackathon pages
+
+    Args:
+        db_path (str): SQLite file (':memory:' for a throwaway index)
+        max_age (float): Seconds stored search results may replace a new search
+    """
+
+    def __init__(self, db_path, max_age=7 * 24 * 3600):
+        self.db_path = db_path
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._db = None
+        self._connect()
+
+    def _connect(self):
+        self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS hackathons ('
+            ' key TEXT PRIMARY KEY,'
+            ' name TEXT NOT NULL,'
+            ' source_url TEXT,'
+            ' search_results TEXT NOT NULL,'
+            ' domain TEXT,'
+            ' technologies TEXT NOT NULL,'
+            ' indexed_at REAL NOT NULL)'
+        )
+        self._db.execute(
+            'CREATE VIRTUAL TABLE IF NOT EXISTS hackathon_fts USING fts5('
+            ' key UNINDEXED, name, snippets, content, domain, technologies,'
+            " tokenize = 'porter unicode61')"
+        )
+        self._db.commit()
+
+    def close(self):
+        """Close the connection (e.g. before forking workers)"""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def reopen(self):
+        """Open a fresh connection (e.g. in a forked worker)"""
+        with self._lock:
+            if self._db is None:
+                self._connect()
+
+    def add(self, key, name, search_results, content, domain, technologies):
+        """
+        Insert or replace one hackathon
+
+        Args:
+            key (str): Normalized hackathon name
+            name (str): Display name
+            search_results (list): Search results ({'title', 'link', 'snippet'})
+            content (str): Scraped page text
+            domain (str): Detected domain
+            technologies (list): Technology names
+        """
+        snippets = ' '.join(
+            f"{result.get('title', '')} {result.get('snippet', '')}" for result in search_results
+        )
+        source_url = search_results[0]['link'] if search_results else None
+        with self._lock:
+            self._db.execute(
+                'INSERT OR REPLACE INTO hackathons'
+                ' (key, name, source_url, search_results, domain, technologies, indexed_at)'
+                ' VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (key, name, source_url, json.dumps(search_results), domain,
+                 json.dumps(technologies), time.time())
+            )
+            self._db.execute('DELETE FROM hackathon_fts WHERE key = ?', (key,))
+            self._db.execute(
+                'INSERT INTO hackathon_fts (key, name, snippets, content, domain, technologies)'
+                ' VALUES (?, ?, ?, ?, ?, ?)',
+                (key, name, snippets, content, domain, ' '.join(technologies))
+            )
+            self._db.commit()
+
+    def known_results(self, key, max_age=None):
+        """
+        Stored search results for a name, if indexed recently enough
+
+        Args:
+            key (str): Normalized hackathon name
+            max_age (float): Override for self.max_age (inf accepts any age)
+
+        Returns:
+            list or None: Search results usable in place of a new search
+        """
+        with self._lock:
+            row = self._db.execute(
+                'SELECT search_results, indexed_at FROM hackathons WHERE key = ?', (key,)
+            ).fetchone()
+        max_age = self.max_age if max_age is None else max_age
+        if row is None or time.time() - row[1] > max_age:
+            return None
+        return json.loads(row[0])
+
+    def search(self, query, limit=10):
+        """
+        Ranked full-text search (BM25; name and domain weigh more than page text)
+
+        Returns:
+            list: Matches with name, source_url, domain, technologies, a
+                  highlighted snippet and the rank score (lower is better)
+        """
+        match = build_match_query(query)
+        if match is None:
+            return []
+
+        with self._lock:
+            rows = self._db.execute(
+                'SELECT h.key, h.name, h.source_url, h.domain, h.technologies, h.indexed_at,'
+                " snippet(hackathon_fts, 3, '[', ']', '...', 12),"
+                ' bm25(hackathon_fts, 0.0, 10.0, 4.0, 1.0, 5.0, 3.0) AS score'
+                ' FROM hackathon_fts JOIN hackathons h ON h.key = hackathon_fts.key'
+                ' WHERE hackathon_fts MATCH ?'
+                ' ORDER BY score LIMIT ?',
+                (match, limit)
+            ).fetchall()
+
+        return [{
+            'key': row[0],
+            'hackathon_name': row[1],
+            'source_url': row[2],
+            'domain': row[3],
+            'technologies': json.loads(row[4]),
+            'indexed_at': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(row[5])),
+            'snippet': row[6],
+            'score': round(row[7], 4),
+        } for row in rows]
+
+    def count(self):
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM hackathons').fetchone()[0]
@@ -0,0 +1,145 @@
+"""
+Production server for the hackathon backend (gunicorn)
+
+`python app.py` runs Flask's single-process development server. This entry
+point runs the same app under gunicorn instead:
+1. Worker model: "processes" (sync workers), "threads" (gthread workers,
+   the default) or "gevent" (green threads; needs `pip install gevent`)
+2. The app is preloaded in the parent process and warmed up (pattern
+   tables, memoized templates, pre-encoded JSON fragments) before any worker
+   is forked, so workers share it copy-on-write and start serving at once
+3. On SIGTERM workers stop accepting connections, finish in-flight requests
+   and drain queued/running background analyses before exiting
+
+Usage:
+    python serve.py
+    python serve.py --worker-model processes --workers 8
+    python serve.py --worker-model gevent --bind 0.0.0.0:8000
+"""
+
+import argparse
+import gc
+import multiprocessing
+import os
+import sys
+
+WORKER_CLASSES = {
+    'processes': 'sync',
+    'threads': 'gthread',
+    'gevent': 'gevent',
+}
+
+BIND = os.environ.get('HACKATHON_BIND', '0.0.0.0:5000')
+WORKER_MODEL = os.environ.get('HACKATHON_WORKER_MODEL', 'threads')
+WORKERS = int(os.environ.get('HACKATHON_WORKERS', multiprocessing.cpu_count()))
+THREADS = int(os.environ.get('HACKATHON_THREADS', 8))
+GEVENT_CONNECTIONS = int(os.environ.get('HACKATHON_GEVENT_CONNECTIONS', 1000))
+REQUEST_TIMEOUT_SECONDS = int(os.environ.get('HACKATHON_REQUEST_TIMEOUT', 120))
+GRACEFUL_TIMEOUT_SECONDS = int(os.environ.get('HACKATHON_GRACEFUL_TIMEOUT', 30))
+WARMUP = os.environ.get('HACKATHON_WARMUP', '1') != '0'
+
+
+def when_ready(server):
+    """Parent process, app preloaded, no workers yet: warm up, then prepare to fork"""
+    import app as backend
+
+    if WARMUP:
+        rendered = backend.warm_up()
+        backend.logger.info("Warmup finished", extra={'samples': rendered})
+
+    # SQLite connections must not be shared across fork - each worker reopens
+    backend.analysis_cache.close()
+    if backend.hackathon_index is not None:
+        backend.hackathon_index.close()
+
+    # Keep the preloaded objects out of the workers' garbage collections, so
+    # their pages stay shared instead of being copied on first collection
+    gc.collect()
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    import app as backend
+
+    backend.analysis_cache.reopen()
+    if backend.hackathon_index is not None:
+        backend.hackathon_index.reopen()
+    if backend.PREWARM_ENABLED:
+        backend.prewarmer.start()
+    if backend.CPU_OFFLOAD:
+        # Each worker gets its own parse/analysis pool (never the parent's)
+        backend.cpu_pool.warm()
+
+
+def worker_exit(server, worker):
+    """Finish background analyses before the worker goes away"""
+    import app as backend
+
+    backend.prewarmer.stop(timeout=5)
+    unfinished = backend.job_manager.drain(timeout=GRACEFUL_TIMEOUT_SECONDS)
+    backend.batch_executor.shutdown(wait=True)
+    backend.cpu_pool.shutdown()
+    if unfinished:
+        backend.logger.warning("Worker exited with unfinished jobs", extra={'unfinished': unfinished})
+
+
+def build_options(args):
+    options = {
+        'bind': args.bind,
+        'workers': args.workers,
+        'worker_class': WORKER_CLASSES[args.worker_model],
+        'preload_app': True,
+        'timeout': args.timeout,
+        'graceful_timeout': args.graceful_timeout,
+        'keepalive': 5,
+        'when_ready': when_ready,
+        'post_fork': post_fork,
+        'worker_exit': worker_exit,
+    }
+    if args.worker_model == 'threads':
+        options['threads'] = args.threads
+    elif args.worker_model == 'gevent':
+        options['worker_connections'] = GEVENT_CONNECTIONS
+    return options
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the hackathon backend under gunicorn')
+    parser.add_argument('--bind', default=BIND)
+    parser.add_argument('--worker-model', choices=sorted(WORKER_CLASSES), default=WORKER_MODEL)
+    parser.add_argument('--workers', type=int, default=WORKERS, help='default: CPU count')
+    parser.add_argument('--threads', type=int, default=THREADS, help='threads per worker (threads model)')
+    parser.add_argument('--timeout', type=int, default=REQUEST_TIMEOUT_SECONDS,
+                        help='seconds before a silent worker is restarted')
+    parser.add_argument('--graceful-timeout', type=int, default=GRACEFUL_TIMEOUT_SECONDS,
+                        help='seconds workers get to drain on shutdown')
+    args = parser.parse_args()
+
+    if args.worker_model == 'gevent':
+        # Patch before the app (and its locks, sockets, thread pools) is imported
+        from gevent import monkey
+        monkey.patch_all()
+
+    from gunicorn.app.base import BaseApplication
+
+    class HackathonServer(BaseApplication):
+        def __init__(self, options):
+            self.options = options
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            from app import app
+            return app
+
+    # The app divides its per-process budgets (prewarm rates, CPU pool) by this
+    os.environ['HACKATHON_WORKERS'] = str(args.workers)
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    HackathonServer(build_options(args)).run()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+"""
+Single-flight coalescing of concurrent identical calls
+
+When many requests ask for the same key at the same time, only the first
+one (the leader) runs the work. The others wait for it and receive the same
+result, or the same exception. Progress events the work publishes go to
+every caller waiting on it, including the ones that joined late (they get
+the earlier events first). Nothing is cached here - once the call
+finishes the key is released, so the result cache stays in charge of reuse.
+"""
+
+import threading
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+        self.events = []
+        self.listeners = []
+        self.lock = threading.Lock()  # Orders event delivery per call
+
+    def subscribe(self, listener):
+        with self.lock:
+            for stage, data in self.events:
+                listener(stage, data)
+            self.listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        with self.lock:
+            self.listeners.remove(listener)
+
+
+class SingleFlight:
+    """Deduplicate concurrent calls that share a key"""
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            'calls': 0,
+            'executions': 0,
+            'coalesced': 0,
+            'errors': 0,
+            'in_flight': 0,
+        }
+
+    def do(self, key, fn, progress=None):
+        """
+        Run fn() once for all concurrent callers with the same key
+
+        Args:
+            key (str): Deduplication key (normalized hackathon name)
+            fn (callable): Zero-argument function doing the work
+            progress (callable): Optional progress(stage, data) hook that
+                                 receives what fn publishes for this key
+                                 while this caller waits
+
+        Returns:
+            tuple: (result, shared) - shared is True when this caller waited
+                   on another caller's execution
+
+        Raises:
+            Exception: Whatever fn() raised, re-raised in every waiter
+        """
+        with self._lock:
+            self._stats['calls'] += 1
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self._stats['coalesced'] += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self._stats['executions'] += 1
+                self._stats['in_flight'] += 1
+                leader = True
+
+        if progress is not None:
+            call.subscribe(progress)
+
+        if not leader:
+            call.done.wait()
+            if progress is not None:
+                call.unsubscribe(progress)
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except Exception as e:
+            call.error = e
+            with self._lock:
+                self._stats['errors'] += 1
+        finally:
+            with self._lock:
+                del self._calls[key]
+                self._stats['in_flight'] -= 1
+            call.done.set()
+            if progress is not None:
+                call.unsubscribe(progress)
+
+        if call.error is not None:
+            raise call.error
+        return call.result, False
+
+    def publish(self, key, stage, data=None):
+        """Send a progress event to every caller waiting on key's in-flight call"""
+        with self._lock:
+            call = self._calls.get(key)
+        if call is None:
+            return
+        with call.lock:
+            call.events.append((stage, data))
+            for listener in call.listeners:
+                listener(stage, data)
+
+    def stats(self):
+        """Counters - 'coalesced' is the number of upstream runs saved"""
+        with self._lock:
+            return dict(self._stats)
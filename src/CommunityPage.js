@@ -85,13 +85,10 @@ export default function CommunityPage() {
     setAnalysisError(null);
     
     try {
-      const response = await fetch('http://localhost:5000/api/analyze-hackathon', {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-        },
-        body: JSON.stringify({ hackathon_name: hackathonName }),
-      });
+      // GET so the browser cache can revalidate with If-None-Match (304 when unchanged)
+      const response = await fetch(
+        `http://localhost:5000/api/analyze-hackathon?hackathon_name=${encodeURIComponent(hackathonName)}`
+      );
       
       const data = await response.json();
       